@@ -10,6 +10,9 @@ Time handling:
 - Query beyond month_end by pad_days to capture late-month composites.
 - Keep rows whose composite window overlaps the month:
     period_start_date <= month_end AND period_end_date >= month_start
+
+Missing cells:
+- Cells that are NaN or fill-valued (cloud cover, land mask) are not emitted as rows.
 """
 
 from __future__ import annotations
@@ -18,27 +21,31 @@ import argparse
 import datetime as dt
 import os
 from pathlib import Path
+from typing import Iterable, Iterator
 
+import numpy as np
 import pandas as pd
 import xarray as xr
 
 from src.ingest.helpers.bigquery import (
-    delete_existing_chl_rows,
-    load_to_bigquery,
+    get_client,
+    load_frames_to_bigquery,
+    merge_replace,
 )
-from src.ingest.helpers.bq_casting import coerce_df_to_schema
+from src.ingest.helpers.bq_casting import coerce_df_to_schema, constant_category
 from src.ingest.helpers.cli_defaults import env_default, env_required
 from src.ingest.helpers.dates import month_range
 from src.ingest.helpers.df_validate import require_columns, require_non_nulls
 from src.ingest.helpers.erddap import build_griddap_dims, build_griddap_nc_url_one, utc_day_bounds
-from src.ingest.helpers.netcdf import ensure_local_netcdf
+from src.ingest.helpers.netcdf import SubsetRequest, ensure_cached_netcdf, netcdf_engine
 from src.ingest.helpers.regions import BoundBox
 from src.ingest.helpers.pipeline import run_tracked
 from src.ingest.helpers.syslogging import LogFn, make_logger
-from src.ingest.helpers.xr_utils import apply_fill_to_nan, standardize_lat_lon
+from src.ingest.helpers.xr_utils import chunk_cache_kwargs, select_bbox, standardize_lat_lon, to_long_dataframe
 from src.ingest.helpers.region_validate import require_region
 
 DEFAULT_MIN_BYTES = 1024
+DEFAULT_CHUNK_TIME = 1  # composites flattened + uploaded per chunk
 PERIOD_START_COL = "period_start_date"
 PERIOD_END_COL = "period_end_date"
 
@@ -49,7 +56,7 @@ OUT_VAR = "chl_mg_m3"
 DRIVER_NAME = "chl"
 SOURCE_NAME = "NOAA_ERDDAP_erdMBchla8day_LonPM180"
 
-RAW_REQUIRED_COLS = {"time", "lat", "lon", OUT_VAR}
+RAW_REQUIRED_COLS = {PERIOD_START_COL, PERIOD_END_COL, "lat", "lon", OUT_VAR}
 
 BQ_SCHEMA = [
     ("period_start_date", "DATE", "REQUIRED"),
@@ -66,6 +73,9 @@ STANDARD_COLS = [name for name, _, _ in BQ_SCHEMA]
 STANDARD_COLS_SET = set(STANDARD_COLS)
 REQUIRED_COLS = [name for name, _, mode in BQ_SCHEMA if mode == "REQUIRED"]
 
+# Row identity within standard.chl_8day: MERGE keys on --replace and the Parquet sort order
+MERGE_KEY_COLS = ["region_id", "period_start_date", "lat", "lon"]
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
         description="Ingest chlorophyll-a 8-day composites via ERDDAP into BigQuery.",
@@ -85,6 +95,8 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--min_bytes", type=int, default=DEFAULT_MIN_BYTES)
     p.add_argument("--log_row_stats", action="store_true")
     p.add_argument("--pad_days", type=int, default=7)
+    p.add_argument("--chunk_time", type=int, default=DEFAULT_CHUNK_TIME)
+    p.add_argument("--gcs_staging_bucket", default=env_default("GCS_STAGING_BUCKET", ""))
     p.add_argument("--log_level", default="INFO", choices=["ERROR", "INFO", "DEBUG"])
     return p.parse_args()
 
@@ -95,13 +107,12 @@ def validate_standardized_dataframe(df: pd.DataFrame) -> None:
     require_columns(df, STANDARD_COLS_SET, label="chl standardized_df")
     require_non_nulls(df, REQUIRED_COLS, label="chl standardized_df")
 
-def build_chl_erddap_url(d0: dt.date, d1: dt.date, bb: BoundBox, *, pad_days: int) -> str:
+def build_chl_subset_request(d0: dt.date, d1: dt.date, bb: BoundBox, *, pad_days: int) -> SubsetRequest:
     """
-    Build a griddap NetCDF URL for chlorophyll subset.
+    Describe the chlorophyll subset to fetch (also the NetCDF cache identity).
 
     Dataset notes:
     - Longitude is -180..180 (no 0..360 conversion).
-    - Includes a singleton altitude dimension at 0.0.
 
     Time window:
     - Query end is extended by pad_days and is end-exclusive:
@@ -112,59 +123,144 @@ def build_chl_erddap_url(d0: dt.date, d1: dt.date, bb: BoundBox, *, pad_days: in
     lat_min, lat_max = sorted([bb.lat_min, bb.lat_max])
     lon_min, lon_max = sorted([bb.lon_min, bb.lon_max])
 
-    dims = build_griddap_dims(
+    return SubsetRequest(
+        dataset_id=DATASET_ID,
         t0=t0,
         t1=t1,
         lat_min=lat_min,
         lat_max=lat_max,
         lon_min=lon_min,
         lon_max=lon_max,
+    )
+
+def build_chl_erddap_url(req: SubsetRequest) -> str:
+    """
+    Build a griddap NetCDF URL for a chlorophyll subset.
+
+    Dataset includes a singleton altitude dimension, sliced at 0.0.
+    """
+    dims = build_griddap_dims(
+        t0=req.t0,
+        t1=req.t1,
+        lat_min=req.lat_min,
+        lat_max=req.lat_max,
+        lon_min=req.lon_min,
+        lon_max=req.lon_max,
         include_singleton_dim=True,  # altitude slice at 0.0
         singleton_value=0.0,
     )
     return build_griddap_nc_url_one(base=ERDDAP_BASE, dataset_id=DATASET_ID, variable=SRC_VAR, dims=dims)
 
-def subset_to_long(ds: xr.Dataset, *, region_id: str, log: LogFn) -> pd.DataFrame:
+def iter_chunks(
+    ds: xr.Dataset,
+    *,
+    region_id: str,
+    d0: dt.date,
+    d1: dt.date,
+    bbox: SubsetRequest | None = None,
+    chunk_time: int = DEFAULT_CHUNK_TIME,
+    ingested_at: pd.Timestamp | None = None,
+    log: LogFn,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield standardized long rows for [d0, d1], chunk_time composites at a time.
+
+    Only one time slice is flattened at once, so peak memory is bounded by a chunk
+    rather than the whole month; callers can upload a chunk while the next decodes.
+
+    bbox: when given, cells outside it are dropped first (the file came from a
+    covering cache entry downloaded for a wider bbox).
+
+    ingested_at: one timestamp for every row the run writes, captured once when the
+    job starts (main passes it), so all chunks of a run match and re-runs stay
+    comparable; defaults to now.
+    """
     da = standardize_lat_lon(ds[SRC_VAR])
 
     if "altitude" in da.dims:
         da = da.sel(altitude=0.0, drop=True)
 
-    da = apply_fill_to_nan(da)
-
-    raw_df = da.to_dataframe(name=OUT_VAR).reset_index()
-    validate_raw_dataframe(raw_df)
+    if bbox is not None:
+        da = select_bbox(
+            da,
+            lat_min=bbox.lat_min,
+            lat_max=bbox.lat_max,
+            lon_min=bbox.lon_min,
+            lon_max=bbox.lon_max,
+        )
 
-    center_ts = pd.to_datetime(raw_df["time"], utc=True)
-    raw_df[PERIOD_START_COL] = (center_ts - pd.Timedelta(days=3)).dt.date
-    raw_df[PERIOD_END_COL] = (center_ts + pd.Timedelta(days=4)).dt.date
-    raw_df.drop(columns=["time"], inplace=True)
+    # Window math runs once per composite on the time axis, then gets repeated per cell.
+    # Composites not overlapping [d0, d1] are dropped here, before any cell is flattened.
+    centers = da["time"].values.astype("datetime64[D]")
+    period_start = centers - np.timedelta64(3, "D")
+    period_end = centers + np.timedelta64(4, "D")
+    keep = (period_start <= np.datetime64(d1, "D")) & (period_end >= np.datetime64(d0, "D"))
+    log(f"composites_overlapping_month={int(keep.sum())}/{keep.size}", level="DEBUG")
+
+    keep_idx = np.flatnonzero(keep)
+    if ingested_at is None:
+        ingested_at = pd.Timestamp.now(tz="UTC")
+
+    for start in range(0, keep_idx.size, chunk_time):
+        idx = keep_idx[start : start + chunk_time]
+        # Fill values are dropped by to_long_dataframe(drop_missing=True) directly on the
+        # raw values (opened with mask_and_scale=False), so no separate masking pass.
+        raw_df = to_long_dataframe(
+            da.isel(time=idx).astype(np.float32, copy=False),
+            value_col=OUT_VAR,
+            time_cols={
+                PERIOD_START_COL: period_start[idx],
+                PERIOD_END_COL: period_end[idx],
+            },
+            drop_missing=True,
+        )
+        if len(raw_df) == 0:
+            continue
+        validate_raw_dataframe(raw_df)
 
-    raw_df["region_id"] = region_id
-    raw_df["source"] = SOURCE_NAME
-    raw_df["ingested_at"] = pd.Timestamp.now(tz="UTC")
+        raw_df["region_id"] = constant_category(region_id, len(raw_df))
+        raw_df["source"] = constant_category(SOURCE_NAME, len(raw_df))
+        raw_df["ingested_at"] = ingested_at
 
-    raw_df[OUT_VAR] = pd.to_numeric(raw_df[OUT_VAR], errors="coerce")
+        # Values come straight from the float NetCDF variable; only coerce odd inputs
+        if not pd.api.types.is_float_dtype(raw_df[OUT_VAR]):
+            raw_df[OUT_VAR] = pd.to_numeric(raw_df[OUT_VAR], errors="coerce")
 
-    df = raw_df.loc[:, STANDARD_COLS].copy()
-    validate_standardized_dataframe(df)
+        # Read-only from here (validate, coerce, serialize): no defensive copy
+        df = raw_df[STANDARD_COLS]
+        validate_standardized_dataframe(df)
 
-    log(f"rows_ready={len(df):,}", level="INFO")
-    return df
+        log(f"chunk_ready start={period_start[idx[0]]} rows={len(df):,}", level="DEBUG")
+        yield df
 
-def filter_overlap_month(df: pd.DataFrame, d0: dt.date, d1: dt.date) -> pd.DataFrame:
-    return df[(df[PERIOD_START_COL] <= d1) & (df[PERIOD_END_COL] >= d0)].copy()
+def with_row_stats(chunks: Iterable[pd.DataFrame], log: LogFn) -> Iterator[pd.DataFrame]:
+    """
+    Pass `chunks` through unchanged, then log one row_stats line for the whole stream.
 
-def log_row_stats(df: pd.DataFrame, log: LogFn) -> None:
-    if len(df) == 0:
+    Counts, min/max dates and the distinct composite windows are accumulated per
+    chunk, so the summary covers the month without holding every chunk at once.
+    """
+    rows = 0
+    min_start = max_end = None
+    windows: set[tuple] = set()
+    for df in chunks:
+        if len(df):
+            rows += len(df)
+            starts, ends = df[PERIOD_START_COL], df[PERIOD_END_COL]
+            min_start = starts.min() if min_start is None else min(min_start, starts.min())
+            max_end = ends.max() if max_end is None else max(max_end, ends.max())
+            windows.update(df[[PERIOD_START_COL, PERIOD_END_COL]].drop_duplicates().itertuples(index=False))
+        yield df
+
+    if rows == 0:
         log("row_stats rows=0", level="INFO")
         return
     log(
         "row_stats "
-        f"rows={len(df):,} "
-        f"min_start={df[PERIOD_START_COL].min()} "
-        f"max_end={df[PERIOD_END_COL].max()} "
-        f"unique_windows={df[[PERIOD_START_COL, PERIOD_END_COL]].drop_duplicates().shape[0]}",
+        f"rows={rows:,} "
+        f"min_start={min_start:%Y-%m-%d} "
+        f"max_end={max_end:%Y-%m-%d} "
+        f"unique_windows={len(windows)}",
         level="INFO",
     )
 
@@ -190,52 +286,99 @@ def main() -> None:
     )
 
     def _job() -> tuple[int, str]:
-        url = build_chl_erddap_url(d0, d1, bb, pad_days=args.pad_days)
+        ingested_at = pd.Timestamp.now(tz="UTC")
+        req = build_chl_subset_request(d0, d1, bb, pad_days=args.pad_days)
+        url = build_chl_erddap_url(req)
         log(f"fetch_url={url}", level="DEBUG")
 
         out_dir = Path(args.out_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
 
-        local_nc = out_dir / f"chl_{args.region_id}_{args.year}_{args.month:02d}.nc"  # CHANGED
-        log(f"download_path={local_nc}", level="DEBUG")
-
-        ensure_local_netcdf(
+        # Content-addressed cache: a file fetched for a covering bbox/window is reused
+        local_nc, cached_req = ensure_cached_netcdf(
             url,
-            local_nc,
+            out_dir,
+            req,
             force_download=args.force_download,
             min_bytes=args.min_bytes,
             log=log,
         )
-
-        with xr.open_dataset(local_nc) as ds:
-            df = subset_to_long(ds, region_id=args.region_id, log=log)
-
-        df = filter_overlap_month(df, d0, d1)
-
-        if args.log_row_stats:
-            log_row_stats(df, log)
+        log(f"download_path={local_nc}", level="DEBUG")
 
         table_id = f"{args.bq_project}.{args.bq_dataset}.{args.bq_table}"
+        # One client for the staging load + MERGE (or append) round trips
+        client = None if args.dry_run else get_client(args.bq_project)
 
-        if args.dry_run:
-            log("dry_run: skipped BigQuery load.", level="INFO")
-            rows_written = 0
-        else:
-            if args.replace:
+        # Lazy per-composite chunks (dask) so iter_chunks only reads what it indexes;
+        # raw values, since fill handling happens while flattening.
+        engine = netcdf_engine(local_nc)
+        with xr.open_dataset(
+            local_nc,
+            engine=engine,
+            chunks={"time": args.chunk_time},
+            mask_and_scale=False,
+            **chunk_cache_kwargs(engine),
+        ) as ds:
+            chunks = iter_chunks(
+                ds,
+                region_id=args.region_id,
+                d0=d0,
+                d1=d1,
+                bbox=None if cached_req == req else req,
+                chunk_time=args.chunk_time,
+                ingested_at=ingested_at,
+                log=log,
+            )
+
+            if args.log_row_stats:
+                chunks = with_row_stats(chunks, log)
+
+            def _frames() -> Iterator[pd.DataFrame]:
+                for df in chunks:
+                    yield df if args.dry_run else coerce_df_to_schema(df, BQ_SCHEMA)
+
+            # Chunks are decoded inside the open dataset while earlier ones upload
+            if args.dry_run:
+                rows_ready = sum(len(df) for df in _frames())
+                log(f"rows_ready={rows_ready:,}", level="INFO")
+                log("dry_run: skipped BigQuery load.", level="INFO")
+                rows_written = 0
+            elif args.replace:
                 log(
-                    f"replace=true delete_existing table={table_id} region={args.region_id} period={d0}..{d1}",
+                    f"replace=true merge_replace table={table_id} region={args.region_id} "
+                    f"period={d0}..{d1}",
                     level="INFO",
                 )
-                delete_existing_chl_rows(
-                    args.bq_project, args.bq_dataset, args.bq_table, args.region_id, d0, d1
+                rows_written = merge_replace(
+                    _frames(),
+                    args.bq_project,
+                    args.bq_dataset,
+                    args.bq_table,
+                    BQ_SCHEMA,
+                    key_cols=MERGE_KEY_COLS,
+                    region_id=args.region_id,
+                    date_start=d0,
+                    date_end=d1,
+                    mode="overlap_window",
+                    gcs_staging_bucket=args.gcs_staging_bucket or None,
+                    sort_by=MERGE_KEY_COLS,
+                    client=client,
                 )
             else:
                 log("replace=false (append only)", level="INFO")
+                rows_written = load_frames_to_bigquery(
+                    _frames(),
+                    args.bq_project,
+                    args.bq_dataset,
+                    args.bq_table,
+                    BQ_SCHEMA,
+                    gcs_staging_bucket=args.gcs_staging_bucket or None,
+                    sort_by=MERGE_KEY_COLS,
+                    client=client,
+                )
 
-            log(f"load_bq table={table_id} rows={len(df):,}", level="INFO")
-            df = coerce_df_to_schema(df, BQ_SCHEMA)
-            load_to_bigquery(df, args.bq_project, args.bq_dataset, args.bq_table, BQ_SCHEMA)
-            rows_written = len(df)
+        if not args.dry_run:
+            log(f"load_bq table={table_id} rows={rows_written:,}", level="INFO")
 
         notes = (
             f"region={args.region_id} year={args.year} month={args.month} "
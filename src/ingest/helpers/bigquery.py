@@ -3,17 +3,65 @@
 from __future__ import annotations
 
 import datetime as dt
+import io
 import os
-from typing import Iterable
+import queue
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Literal, Mapping, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.cloud import bigquery
 
 BQSchema = list[tuple[str, str, str]]
+# What the load helpers accept: a DataFrame, or an Arrow table already typed by the schema
+LoadData = pd.DataFrame | pa.Table
+WindowMode = Literal["date_range", "overlap_window"]
 
 DEFAULT_BQ_LOCATION = os.getenv("BQ_LOCATION", "asia-southeast2")
+DEFAULT_LOAD_CHUNK_ROWS = 500_000
+LOAD_MAX_WORKERS = 4
+LOAD_MAX_PENDING_FRAMES = 2  # streamed frames buffered ahead of the uploader
+STAGING_TABLE_TTL = dt.timedelta(hours=6)
+GCS_STAGING_PREFIX = "staging"
+GCS_UPLOAD_TIMEOUT_S = 300
+
+# Longest period_end_date - period_start_date among composite tables (chl 8-day: 7).
+MAX_COMPOSITE_SPAN_DAYS = 7
+
+_ARROW_TYPES: dict[str, pa.DataType] = {
+    "DATE": pa.date32(),
+    "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+    "FLOAT64": pa.float64(),
+    "INT64": pa.int64(),
+    "STRING": pa.string(),
+}
+
+# Row filters selecting one region's rows within [@d0, @d1], per table layout.
+# `{t}` is the target table alias; shared by the --replace DELETE and MERGE paths.
+_WINDOW_PREDICATES: dict[str, str] = {
+    "date_range": (
+        "{t}.region_id = @region_id"
+        " AND {t}.date BETWEEN @d0 AND @d1"
+    ),
+    # The explicit lower bound on period_start_date (the partition column) keeps the
+    # statement to the few partitions a composite overlapping [d0, d1] can start in;
+    # without it every partition before d1 is scanned.
+    "overlap_window": (
+        "{t}.region_id = @region_id"
+        f" AND {{t}}.period_start_date BETWEEN DATE_SUB(@d0, INTERVAL {MAX_COMPOSITE_SPAN_DAYS} DAY) AND @d1"
+        " AND {t}.period_end_date >= @d0"
+    ),
+}
+_DELETE_SQL_CACHE: dict[tuple[str, str], str] = {}
 
 _CLIENT_CACHE: dict[str, bigquery.Client] = {}
+_STORAGE_CLIENT_CACHE: dict[str, object] = {}
 
 def get_client(project: str) -> bigquery.Client:
     """
@@ -28,104 +76,484 @@ def get_client(project: str) -> bigquery.Client:
         _CLIENT_CACHE[project] = client
     return client
 
+def get_storage_client(project: str):
+    """
+    Return a cached google.cloud.storage Client per project.
+
+    Imported lazily: only GCS-staged loads (--gcs_staging_bucket) need the package.
+    """
+    client = _STORAGE_CLIENT_CACHE.get(project)
+    if client is None:
+        from google.cloud import storage
+
+        client = storage.Client(project=project)
+        _STORAGE_CLIENT_CACHE[project] = client
+    return client
+
+def bq_schema_to_arrow(bq_schema: BQSchema) -> pa.Schema:
+    """
+    Build the pyarrow schema matching a (name, bq_type, mode) BigQuery schema.
+
+    REQUIRED columns become non-nullable fields, so nulls fail at conversion time.
+    """
+    fields: list[pa.Field] = []
+    for name, typ, mode in bq_schema:
+        arrow_type = _ARROW_TYPES.get(typ.upper())
+        if arrow_type is None:
+            raise ValueError(f"Unsupported BigQuery type for Parquet load: {name} {typ}")
+        fields.append(pa.field(name, arrow_type, nullable=mode.upper() != "REQUIRED"))
+    return pa.schema(fields)
+
+def dataframe_to_arrow(df: LoadData, bq_schema: BQSchema) -> pa.Table:
+    """
+    Convert a DataFrame to an Arrow table typed by `bq_schema`.
+
+    Columns not in the schema are dropped.
+    Categorical STRING columns are kept dictionary-encoded instead of expanded per row.
+    float32 FLOAT64 columns stay float32 in Parquet: half the memory and upload bytes,
+    and BigQuery widens them to FLOAT64 on load, so drivers can emit float32 values
+    end to end.
+
+    An Arrow table is passed through (schema columns selected, in schema order): callers
+    that build tables straight from NumPy arrays skip pandas entirely.
+    """
+    if isinstance(df, pa.Table):
+        return df.select([name for name, _, _ in bq_schema])
+
+    schema = bq_schema_to_arrow(bq_schema)
+    for i, field in enumerate(schema):
+        col = df.get(field.name)
+        if col is None:
+            continue
+        if field.type == pa.string() and isinstance(col.dtype, pd.CategoricalDtype):
+            index_type = pa.from_numpy_dtype(col.cat.codes.dtype)
+            schema = schema.set(i, field.with_type(pa.dictionary(index_type, pa.string())))
+        elif field.type == pa.float64() and col.dtype == np.float32:
+            schema = schema.set(i, field.with_type(pa.float32()))
+
+    return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+def columns_to_arrow(columns: Mapping[str, object], bq_schema: BQSchema) -> pa.Table:
+    """
+    Build an Arrow table typed by `bq_schema` straight from NumPy columns (no pandas).
+
+    - ndarray columns: NaN -> null; float32 FLOAT64 columns stay float32 (see
+      dataframe_to_arrow)
+    - scalar columns (one value for every row) are broadcast: STRING as a one-entry
+      dictionary, anything else (e.g. an ingested_at Timestamp) via pa.repeat
+
+    Constant STRING columns (region_id, source) all share one int8 all-zero index
+    buffer: n bytes in total (not per column, and never n Python string objects).
+    """
+    n = next(len(v) for v in columns.values() if isinstance(v, np.ndarray))
+    zero_codes: pa.Array | None = None
+    arrays: list[pa.Array] = []
+    fields: list[pa.Field] = []
+    for field in bq_schema_to_arrow(bq_schema):
+        value = columns[field.name]
+        if isinstance(value, np.ndarray):
+            typ = pa.float32() if field.type == pa.float64() and value.dtype == np.float32 else field.type
+            arr = pa.array(value, type=typ, from_pandas=True)
+        elif field.type == pa.string():
+            if zero_codes is None:
+                zero_codes = pa.array(np.zeros(n, dtype=np.int8))
+            arr = pa.DictionaryArray.from_arrays(zero_codes, pa.array([value]))
+        else:
+            arr = pa.repeat(pa.scalar(value, type=field.type), n)
+        arrays.append(arr)
+        fields.append(field.with_type(arr.type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+def dataframe_to_parquet(df: LoadData, bq_schema: BQSchema) -> io.BytesIO:
+    """
+    Serialize a DataFrame to an in-memory Snappy Parquet file typed by `bq_schema`.
+
+    The buffer is rewound and ready to upload.
+    """
+    buf = io.BytesIO()
+    pq.write_table(dataframe_to_arrow(df, bq_schema), buf, compression="snappy", use_dictionary=True)
+    buf.seek(0)
+    return buf
+
+def load_via_gcs(
+    data: LoadData,
+    project: str,
+    dataset: str,
+    table: str,
+    bq_schema: BQSchema,
+    gcs_staging_bucket: str,
+    *,
+    client: bigquery.Client | None = None,
+) -> None:
+    """
+    Append a DataFrame or Arrow table by staging it as Parquet in GCS and loading from the URI.
+
+    Steps:
+    1) write Snappy Parquet to a local temp file
+    2) upload to gs://<bucket>/staging/<table>/<uuid>.parquet (resumable for large files)
+    3) load_table_from_uri (WRITE_APPEND) -- BigQuery reads from GCS over Google's network
+    4) delete the blob (on failure it is left in place for debugging)
+    """
+    client = client or get_client(project)
+    blob = get_storage_client(project).bucket(gcs_staging_bucket).blob(
+        f"{GCS_STAGING_PREFIX}/{table}/{uuid.uuid4().hex}.parquet"
+    )
+
+    _upload_parquet_blob(data, bq_schema, blob)
+    _load_parquet_uri(client, f"gs://{gcs_staging_bucket}/{blob.name}", f"{project}.{dataset}.{table}", bq_schema)
+
+    blob.delete()
+
+def _upload_parquet_blob(data: LoadData, bq_schema: BQSchema, blob) -> None:
+    """Write `data` as Snappy Parquet to a local temp file and upload it to `blob` (resumable)."""
+    with tempfile.NamedTemporaryFile(suffix=".parquet") as tmp:
+        pq.write_table(dataframe_to_arrow(data, bq_schema), tmp.name, compression="snappy", use_dictionary=True)
+        blob.upload_from_filename(tmp.name, timeout=GCS_UPLOAD_TIMEOUT_S)
+
+def _load_parquet_uri(client: bigquery.Client, gs_uri: str, table_id: str, bq_schema: BQSchema) -> None:
+    """One WRITE_APPEND load job from a gs:// Parquet URI (a `*` wildcard loads every match)."""
+    job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        schema=[bigquery.SchemaField(name, typ, mode=mode) for name, typ, mode in bq_schema],
+    )
+    client.load_table_from_uri(gs_uri, table_id, job_config=job_config, location=DEFAULT_BQ_LOCATION).result()
+
+def _sort_rows(data: LoadData, sort_by: Sequence[str] | None) -> LoadData:
+    if sort_by and isinstance(data, pa.Table):
+        return data.sort_by([(c, "ascending") for c in sort_by])
+    if sort_by:
+        return data.sort_values(list(sort_by), kind="mergesort", ignore_index=True)
+    return data
+
 def load_to_bigquery(
-    df: pd.DataFrame,
+    data: LoadData,
     project: str,
     dataset: str,
     table: str,
     bq_schema: BQSchema,
+    *,
+    chunk_rows: int = DEFAULT_LOAD_CHUNK_ROWS,
+    gcs_staging_bucket: str | None = None,
+    sort_by: Sequence[str] | None = None,
+    client: bigquery.Client | None = None,
 ) -> None:
     """
-    Append a DataFrame into an existing BigQuery table using the table's schema.
+    Append a DataFrame or Arrow table into an existing BigQuery table using the table's schema.
+
+    The data is uploaded as Parquet (columnar batch load job) rather than through
+    load_table_from_dataframe's generic serialization path.
+
+    Chunking:
+    - Inputs larger than chunk_rows are converted to Arrow once (tables pass
+      through) and split into zero-copy slices, each its own WRITE_APPEND load job,
+      submitted from a small thread pool so uploads overlap.
+    - Jobs are independent: if one fails, slices from other jobs may already be
+      appended (use --replace to re-run the month cleanly).
+
+    gcs_staging_bucket: if set, the whole input goes through load_via_gcs instead
+    (one file, one load job; faster than HTTP uploads for large months).
+
+    sort_by: optional columns to (stably) sort rows by before writing Parquet. Runs of
+    equal keys encode much smaller (RLE/dictionary) and land in fewer BigQuery blocks.
+
+    client: optional pre-built client; defaults to the cached get_client(project).
     """
+    data = _sort_rows(data, sort_by)
+
+    if gcs_staging_bucket:
+        load_via_gcs(data, project, dataset, table, bq_schema, gcs_staging_bucket, client=client)
+        return
 
-    client = get_client(project)
+    client = client or get_client(project)
     table_id = f"{project}.{dataset}.{table}"
     
     job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.PARQUET,
         write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
         schema=[bigquery.SchemaField(name, typ, mode=mode) for name, typ, mode in bq_schema]
     )
-    client.load_table_from_dataframe(
-        df,
-        table_id,
-        job_config=job_config,
-        location=DEFAULT_BQ_LOCATION,
-    ).result()
 
-def _delete_where(
+    def _submit(part: LoadData) -> bigquery.LoadJob:
+        return client.load_table_from_file(
+            dataframe_to_parquet(part, bq_schema),
+            table_id,
+            job_config=job_config,
+            location=DEFAULT_BQ_LOCATION,
+        )
+
+    if len(data) <= chunk_rows:
+        _submit(data).result()
+        return
+
+    # One pandas -> Arrow conversion for the whole frame; the slices are then zero-copy
+    # views, and each job only encodes its Parquet bytes
+    table_data = data if isinstance(data, pa.Table) else dataframe_to_arrow(data, bq_schema)
+    parts = (table_data.slice(i, chunk_rows) for i in range(0, len(table_data), chunk_rows))
+    with ThreadPoolExecutor(max_workers=LOAD_MAX_WORKERS) as pool:
+        jobs = list(pool.map(_submit, parts))
+
+    for job in jobs:
+        job.result()
+
+def load_frames_to_bigquery(
+    frames: Iterable[LoadData],
+    project: str,
+    dataset: str,
+    table: str,
+    bq_schema: BQSchema,
+    *,
+    chunk_rows: int = DEFAULT_LOAD_CHUNK_ROWS,
+    max_pending: int = LOAD_MAX_PENDING_FRAMES,
+    gcs_staging_bucket: str | None = None,
+    sort_by: Sequence[str] | None = None,
+    client: bigquery.Client | None = None,
+) -> int:
+    """
+    Append a stream of DataFrames or Arrow tables, uploading each while the next one is produced.
+
+    A background thread takes frames from a bounded queue (max_pending), so at most a
+    few frames are held in memory at once and decoding overlaps with upload. Returns
+    the number of rows loaded.
+
+    - default: each frame goes through load_to_bigquery (its own load job(s)). Same
+      partial-append caveat: a failure mid-stream leaves earlier frames appended.
+    - gcs_staging_bucket: each frame is uploaded as one Parquet blob under a single
+      per-call prefix gs://<bucket>/staging/<table>/<uuid>/, then ONE load job reads
+      them all through a wildcard URI (all-or-nothing); the blobs are deleted after.
+      On failure they are left in place for debugging.
+    """
+    client = client or get_client(project)
+    pending: queue.Queue[LoadData | None] = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+
+    staged: list = []
+    if gcs_staging_bucket:
+        bucket = get_storage_client(project).bucket(gcs_staging_bucket)
+        prefix = f"{GCS_STAGING_PREFIX}/{table}/{uuid.uuid4().hex}"
+
+    def _load(part: LoadData) -> None:
+        if not gcs_staging_bucket:
+            load_to_bigquery(
+                part,
+                project,
+                dataset,
+                table,
+                bq_schema,
+                chunk_rows=chunk_rows,
+                sort_by=sort_by,
+                client=client,
+            )
+            return
+        blob = bucket.blob(f"{prefix}/part-{len(staged):05d}.parquet")
+        _upload_parquet_blob(_sort_rows(part, sort_by), bq_schema, blob)
+        staged.append(blob)
+
+    def _consume() -> None:
+        while True:
+            part = pending.get()
+            if part is None:
+                return
+            if stop.is_set():
+                continue
+            try:
+                _load(part)
+            except BaseException as e:  # surfaced on the producer thread below
+                errors.append(e)
+                stop.set()
+
+    worker = threading.Thread(target=_consume, name="bq-load", daemon=True)
+    worker.start()
+
+    rows = 0
+    try:
+        for df in frames:
+            if stop.is_set():
+                break
+            if len(df) == 0:
+                continue
+            pending.put(df)
+            rows += len(df)
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        pending.put(None)
+        worker.join()
+
+    if errors:
+        raise errors[0]
+
+    if staged:
+        _load_parquet_uri(
+            client, f"gs://{gcs_staging_bucket}/{prefix}/*.parquet", f"{project}.{dataset}.{table}", bq_schema
+        )
+        for blob in staged:
+            blob.delete()
+    return rows
+
+def _window_predicate(mode: WindowMode, *, alias: str) -> str:
+    template = _WINDOW_PREDICATES.get(mode)
+    if template is None:
+        raise ValueError(f"Unknown window mode {mode!r}. Known: {sorted(_WINDOW_PREDICATES)}")
+    return template.format(t=alias)
+
+def _window_params(region_id: str, date_start: dt.date, date_end: dt.date) -> list[bigquery.ScalarQueryParameter]:
+    return [
+        bigquery.ScalarQueryParameter("region_id", "STRING", region_id),
+        bigquery.ScalarQueryParameter("d0", "DATE", date_start),
+        bigquery.ScalarQueryParameter("d1", "DATE", date_end),
+    ]
+
+def _delete_sql(table_id: str, mode: WindowMode) -> str:
+    """
+    Return the DELETE statement for (table_id, mode), formatting each template once per process.
+
+    _DELETE_SQL_CACHE is unbounded (one entry per table x mode ever deleted from);
+    that is a handful of strings for the CLI drivers.
+    """
+    key = (table_id, mode)
+    sql = _DELETE_SQL_CACHE.get(key)
+    if sql is None:
+        sql = f"DELETE FROM `{table_id}` T WHERE {_window_predicate(mode, alias='T')}"
+        _DELETE_SQL_CACHE[key] = sql
+    return sql
+
+def delete_rows(
     *,
     project: str,
     dataset: str,
     table: str,
-    sql: str,
-    params: Iterable[bigquery.ScalarQueryParameter],
+    region_id: str,
+    date_start: dt.date,
+    date_end: dt.date,
+    mode: WindowMode,
     location: str = DEFAULT_BQ_LOCATION,
+    client: bigquery.Client | None = None,
 ) -> None:
-    client = get_client(project)
+    """
+    Idempotency delete: remove rows for region_id within the inclusive window [date_start, date_end].
+
+    Modes:
+    - date_range: daily tables, rows where date BETWEEN date_start AND date_end
+    - overlap_window: composite tables, rows whose window overlaps the range:
+        period_start_date <= date_end AND period_end_date >= date_start
+    """
+    client = client or get_client(project)
     table_id = f"{project}.{dataset}.{table}"
 
-    job_config = bigquery.QueryJobConfig(query_parameters=list(params))
-    client.query(sql.format(table_id=table_id), job_config=job_config, location=location).result()
+    job_config = bigquery.QueryJobConfig(query_parameters=_window_params(region_id, date_start, date_end))
+    client.query(_delete_sql(table_id, mode), job_config=job_config, location=location).result()
 
-def delete_existing_sst_rows(
+def merge_replace(
+    df: LoadData | Iterable[LoadData],
     project: str,
     dataset: str,
     table: str,
+    bq_schema: BQSchema,
+    *,
+    key_cols: Sequence[str],
     region_id: str,
     date_start: dt.date,
     date_end: dt.date,
-) -> None:
-    """
-    SST idempotency: delete rows for region where date is within [date_start, date_end].
+    mode: WindowMode,
+    chunk_rows: int = DEFAULT_LOAD_CHUNK_ROWS,
+    location: str = DEFAULT_BQ_LOCATION,
+    gcs_staging_bucket: str | None = None,
+    sort_by: Sequence[str] | None = None,
+    client: bigquery.Client | None = None,
+) -> int:
     """
-    sql = """
-    DELETE FROM `{table_id}`
-    WHERE region_id = @region_id
-      AND date BETWEEN @d0 AND @d1
+    Replace region_id's rows within [date_start, date_end] with `df` in one MERGE statement.
+
+    Equivalent to delete_rows(...) + load_to_bigquery(...), but atomic: readers never
+    see the window half-deleted, and only one DML job touches the target.
+
+    Steps:
+    1) load df into a staging table `{table}__stg_<uuid>` (expires after STAGING_TABLE_TTL)
+    2) MERGE INTO target T USING staging S ON key_cols:
+       - WHEN MATCHED (in window)          -> UPDATE non-key columns
+       - WHEN NOT MATCHED BY TARGET        -> INSERT
+       - WHEN NOT MATCHED BY SOURCE (in window) -> DELETE (rows no longer produced)
+    3) drop the staging table (on failure it is left for debugging and expires on its own)
+
+    The window predicate (same as delete_rows `mode`) appears in each WHEN clause so
+    BigQuery can prune target partitions.
+
+    df may also be an iterable of frames; they are streamed into staging with
+    load_frames_to_bigquery. Returns the number of staged rows.
     """
-    _delete_where(
-        project=project,
-        dataset=dataset,
-        table=table,
-        sql=sql,
-        params=[
-            bigquery.ScalarQueryParameter("region_id", "STRING", region_id),
-            bigquery.ScalarQueryParameter("d0", "DATE", date_start),
-            bigquery.ScalarQueryParameter("d1", "DATE", date_end),
-        ],
+    client = client or get_client(project)
+    table_id = f"{project}.{dataset}.{table}"
+    staging_table = f"{table}__stg_{uuid.uuid4().hex}"
+    staging_id = f"{project}.{dataset}.{staging_table}"
+
+    staging = bigquery.Table(
+        staging_id,
+        schema=[bigquery.SchemaField(name, typ, mode=col_mode) for name, typ, col_mode in bq_schema],
     )
+    staging.expires = dt.datetime.now(dt.timezone.utc) + STAGING_TABLE_TTL
+    client.create_table(staging)
 
-def delete_existing_chl_rows(
+    if isinstance(df, (pd.DataFrame, pa.Table)):
+        df = [df]
+    rows = load_frames_to_bigquery(
+        df,
+        project,
+        dataset,
+        staging_table,
+        bq_schema,
+        chunk_rows=chunk_rows,
+        gcs_staging_bucket=gcs_staging_bucket,
+        sort_by=sort_by,
+        client=client,
+    )
+
+    cols = [name for name, _, _ in bq_schema]
+    keys = set(key_cols)
+    update_cols = [c for c in cols if c not in keys]
+    in_window = _window_predicate(mode, alias="T")
+
+    sql = f"""
+    MERGE `{table_id}` T
+    USING `{staging_id}` S
+    ON {" AND ".join(f"T.{c} = S.{c}" for c in key_cols)}
+    WHEN MATCHED AND {in_window} THEN
+      UPDATE SET {", ".join(f"{c} = S.{c}" for c in update_cols)}
+    WHEN NOT MATCHED BY TARGET THEN
+      INSERT ({", ".join(cols)}) VALUES ({", ".join(f"S.{c}" for c in cols)})
+    WHEN NOT MATCHED BY SOURCE AND {in_window} THEN
+      DELETE
+    """
+    job_config = bigquery.QueryJobConfig(query_parameters=_window_params(region_id, date_start, date_end))
+    client.query(sql, job_config=job_config, location=location).result()
+
+    client.delete_table(staging_id, not_found_ok=True)
+    return rows
+
+def delete_existing_sst_rows(
     project: str,
     dataset: str,
     table: str,
     region_id: str,
     date_start: dt.date,
     date_end: dt.date,
+    *,
+    client: bigquery.Client | None = None,
 ) -> None:
     """
-    CHL idempotency: delete rows whose composite window overlaps [date_start, date_end].
-
-    Overlap rule:
-      period_start_date <= date_end AND period_end_date >= date_start
-    """
-    sql = """
-    DELETE FROM `{table_id}`
-    WHERE region_id = @region_id
-      AND period_start_date <= @d1
-      AND period_end_date >= @d0
+    SST idempotency: delete rows for region where date is within [date_start, date_end].
     """
-    _delete_where(
+    delete_rows(
         project=project,
         dataset=dataset,
         table=table,
-        sql=sql,
-        params=[
-            bigquery.ScalarQueryParameter("region_id", "STRING", region_id),
-            bigquery.ScalarQueryParameter("d0", "DATE", date_start),
-            bigquery.ScalarQueryParameter("d1", "DATE", date_end),
-        ],
+        region_id=region_id,
+        date_start=date_start,
+        date_end=date_end,
+        mode="date_range",
+        client=client,
     )
 
 def delete_existing_waves_rows(
@@ -135,26 +563,28 @@ def delete_existing_waves_rows(
     region_id: str,
     date_start: dt.date,
     date_end: dt.date,
+    *,
+    client: bigquery.Client | None = None,
 ) -> None:
     """
     Waves idempotency: delete existing rows for region_id within the inclusive date window
-    [date_start, date_end]. Used for --replace month reloads.    
-    """
-    sql = """
-    DELETE FROM `{table_id}`
-    WHERE region_id = @region_id
-      AND date BETWEEN @d0 AND @d1
+    [date_start, date_end]. Used for --replace month reloads.
+
+    Partition pruning:
+      waves_daily is DAY-partitioned on date and clustered by region_id
+      (sql/create_standard_tables.sql); the parameterized date BETWEEN @d0 AND @d1
+      predicate limits the DELETE to the month's partitions, and region_id to its
+      clustered blocks within them.
     """
-    _delete_where(
+    delete_rows(
         project=project,
         dataset=dataset,
         table=table,
-        sql=sql,
-        params=[
-            bigquery.ScalarQueryParameter("region_id", "STRING", region_id),
-            bigquery.ScalarQueryParameter("d0", "DATE", date_start),
-            bigquery.ScalarQueryParameter("d1", "DATE", date_end),
-        ],
+        region_id=region_id,
+        date_start=date_start,
+        date_end=date_end,
+        mode="date_range",
+        client=client,
     )
 
 def _to_rfc3339_utc(ts: dt.datetime) -> str:
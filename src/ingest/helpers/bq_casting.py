@@ -3,8 +3,18 @@ from __future__ import annotations
 
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
+def constant_category(value: str, n: int) -> pd.Categorical:
+    """
+    Build a length-n column holding one repeated string as a Categorical.
+
+    Stores n int8 codes plus a single copy of `value`, instead of n object references;
+    the Parquet load path writes it as a dictionary-encoded STRING column.
+    """
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
+
 def coerce_df_to_schema(df: pd.DataFrame, schema: Iterable[tuple[str, str, str]]) -> pd.DataFrame:
     """
     Coerce DataFrame columns to match BigQuery schema types as best as possible.
@@ -24,19 +34,36 @@ def coerce_df_to_schema(df: pd.DataFrame, schema: Iterable[tuple[str, str, str]]
         t = bq_type.upper()
 
         if t == "DATE":
-            df[name] = pd.to_datetime(df[name], errors="coerce").dt.date
+            # datetime64 day columns load as DATE as-is (Arrow casts them to date32).
+            # Other inputs are parsed and floored to the day, staying datetime64
+            # instead of a per-row datetime.date object column.
+            if not pd.api.types.is_datetime64_dtype(df[name]):
+                ts = pd.to_datetime(df[name], errors="coerce")
+                if isinstance(ts.dtype, pd.DatetimeTZDtype):
+                    ts = ts.dt.tz_localize(None)  # wall-clock day, as .dt.date gave
+                df[name] = ts.dt.floor("D")
 
         elif t == "TIMESTAMP":
-            df[name] = pd.to_datetime(df[name], errors="coerce", utc=True)
+            # A broadcast tz-aware Timestamp (ingested_at) is already an int64-backed
+            # datetime64[.., UTC] column: no per-row parse, at most a tz conversion
+            col = df[name]
+            if not isinstance(col.dtype, pd.DatetimeTZDtype):
+                df[name] = pd.to_datetime(col, errors="coerce", utc=True)
+            elif str(col.dt.tz) != "UTC":
+                df[name] = col.dt.tz_convert("UTC")
 
         elif t in ("FLOAT64", "NUMERIC", "BIGNUMERIC"):
-            df[name] = pd.to_numeric(df[name], errors="coerce")
+            # Float columns (incl. float32 kept for a smaller Parquet) are already numeric
+            if not pd.api.types.is_float_dtype(df[name]):
+                df[name] = pd.to_numeric(df[name], errors="coerce")
 
         elif t == "INT64":
             df[name] = pd.to_numeric(df[name], errors="coerce").astype("Int64")
 
         elif t == "STRING":
-            df[name] = df[name].astype("string").where(df[name].notna(), pd.NA)
+            # Categorical string columns are already load-stable (dictionary-encoded)
+            if not isinstance(df[name].dtype, pd.CategoricalDtype):
+                df[name] = df[name].astype("string").where(df[name].notna(), pd.NA)
 
         else:
             pass
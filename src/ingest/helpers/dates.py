@@ -15,3 +15,22 @@ def month_range(
     else:
         end = dt.date(year, month + 1, 1) - dt.timedelta(days=1)
     return start, end
+
+def day_windows(
+    start: dt.date,
+    end: dt.date,
+    days: int
+) -> list[tuple[dt.date, dt.date]]:
+    """
+    Split the inclusive range [start, end] into consecutive inclusive windows of
+    at most `days` days (the last one may be shorter).
+    """
+    if days < 1:
+        raise ValueError(f"days must be >= 1, got {days}")
+    windows: list[tuple[dt.date, dt.date]] = []
+    w0 = start
+    while w0 <= end:
+        w1 = min(w0 + dt.timedelta(days=days - 1), end)
+        windows.append((w0, w1))
+        w0 = w1 + dt.timedelta(days=1)
+    return windows
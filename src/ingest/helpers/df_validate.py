@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Iterable
 import pandas as pd
+import pyarrow as pa
 
 def require_columns(
     df: pd.DataFrame,
@@ -11,8 +12,9 @@ def require_columns(
     *,
     label: str
 ) -> None:
-    cols = set(df.columns)
-    missing = required - cols
+    # Index membership is hashed; the full column listing is only built when raising
+    cols = df.columns
+    missing = [c for c in required if c not in cols]
     if missing:
         raise ValueError(
             f'{label} missing columns: {sorted(missing)}. '
@@ -25,7 +27,21 @@ def require_non_nulls(
     *,
     label: str
 ) -> None:
-    required_cols = list(required_cols)
-    if df[required_cols].isna().any().any():
-        bad = df[df[required_cols].isna().any(axis=1)].head(10)
-        raise ValueError(f'{label} nulls in required columns:\n{bad}')
+    # Per column: no 2D boolean frame, and stops at the first column with a null
+    for c in required_cols:
+        null_mask = df[c].isna().to_numpy()
+        if null_mask.any():
+            bad = df[null_mask].head(10)
+            raise ValueError(f'{label} nulls in required column {c!r}:\n{bad}')
+
+def require_table_non_nulls(
+    table: pa.Table,
+    required_cols: Iterable[str],
+    *,
+    label: str
+) -> None:
+    # Arrow keeps a per-column null count: no scan at all for the check
+    for c in required_cols:
+        n_null = table.column(c).null_count
+        if n_null:
+            raise ValueError(f'{label} {n_null} nulls in required column {c!r}')
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import datetime as dt
+import re
 from typing import Sequence
 from urllib.parse import quote
 
+# Characters left unquoted in the query (quote() also never touches A-Za-z0-9_.-~).
+ERDDAP_QUERY_SAFE = "=:/?&()[]%,.;-_T+Z"
+_NEEDS_QUOTING = re.compile(r"[^A-Za-z0-9_.\-~" + re.escape(ERDDAP_QUERY_SAFE) + r"]")
+# url -> quoted url; regions x months x datasets is a small, repeating set. Unbounded
+# (never evicts): fine for a CLI run, grows with every distinct URL in a long-lived process
+_QUOTED_URL_CACHE: dict[str, str] = {}
 
 def utc_day_bounds(
     date_start: dt.date,
@@ -36,12 +43,22 @@ def quote_erddap_url(url: str) -> str:
 
     ERDDAP URLs commonly contain parentheses, brackets, colons, commas, etc.
     We avoid quoting the base URL to prevent breaking the endpoint host/path.
+
+    Fast path: URLs built by build_griddap_nc_url* usually contain only safe
+    characters, so a single precompiled scan returns them untouched. Results are
+    memoized per URL in _QUOTED_URL_CACHE, which is unbounded.
     """
+    cached = _QUOTED_URL_CACHE.get(url)
+    if cached is not None:
+        return cached
+
     base, _, query = url.partition("?")
-    if not query:
-        return url
-    safe_query = quote(query, safe="=:/?&()[]%,.;-_T+Z")
-    return base + "?" + safe_query
+    if not query or _NEEDS_QUOTING.search(query) is None:
+        safe_url = url
+    else:
+        safe_url = base + "?" + quote(query, safe=ERDDAP_QUERY_SAFE)
+    _QUOTED_URL_CACHE[url] = safe_url
+    return safe_url
 
 
 def lon_to_360(lon: float) -> float:
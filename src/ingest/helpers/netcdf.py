@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import datetime as dt
+import hashlib
+import json
+import os
+import random
 import shutil
+import socket
 import time
-import urllib.request
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from urllib.error import HTTPError, URLError
+from typing import BinaryIO
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+import urllib3
+from urllib3.connection import HTTPConnection
 
 from src.ingest.helpers.erddap import quote_erddap_url
 from src.ingest.helpers.syslogging import LogFn, LogLevel
@@ -14,8 +25,89 @@ from src.ingest.helpers.syslogging import LogFn, LogLevel
 DEFAULT_MIN_BYTES = 1024
 MAX_DOWNLOAD_ATTEMPTS = 3
 BACKOFF_BASE_SECONDS = 2
+MAX_RETRY_AFTER_SECONDS = 120
+DOWNLOAD_BUFFER_BYTES = 1024 * 1024
+_HTTP_HEADERS = {"User-Agent": "ocean-drivers-anomaly-detection/1.0"}
+HTTP_POOL_MAXSIZE = 4
+SOCKET_RCVBUF_BYTES = 1024 * 1024
+_HTTP_POOL: urllib3.PoolManager | None = None
+
+# (path, st_mtime_ns, st_size) -> first 4 header bytes; see _header_bytes. Unbounded:
+# a rewritten file adds a new key and the old one stays, so long-lived processes
+# that churn files should call reset_validation_cache()
+_HEADER_CACHE: dict[tuple[str, int, int], bytes] = {}
+
+
+@dataclass(frozen=True)
+class SubsetRequest:
+    """
+    The ERDDAP subset a cached NetCDF was downloaded for.
+
+    t0/t1 are the griddap time bounds (ISO8601 UTC); lat/lon bounds are in the
+    dataset's own longitude convention.
+    """
+    dataset_id: str
+    t0: str
+    t1: str
+    lat_min: float
+    lat_max: float
+    lon_min: float
+    lon_max: float
+
+    def cache_key(self) -> str:
+        raw = (
+            f"{self.dataset_id}|{self.t0}|{self.t1}|"
+            f"{round(self.lat_min, 2)}|{round(self.lat_max, 2)}|"
+            f"{round(self.lon_min, 2)}|{round(self.lon_max, 2)}"
+        )
+        return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+    def covers(self, other: "SubsetRequest") -> bool:
+        """True if this subset contains `other` (same dataset, superset time window and bbox)."""
+        return (
+            self.dataset_id == other.dataset_id
+            and _parse_utc(self.t0) <= _parse_utc(other.t0)
+            and _parse_utc(self.t1) >= _parse_utc(other.t1)
+            and self.lat_min <= other.lat_min
+            and self.lat_max >= other.lat_max
+            and self.lon_min <= other.lon_min
+            and self.lon_max >= other.lon_max
+        )
 
 
+def _parse_utc(ts: str) -> dt.datetime:
+    return dt.datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+def reset_validation_cache() -> None:
+    """
+    Forget every cached NetCDF header.
+
+    The cache never evicts (one 4-byte entry per (path, mtime, size) ever validated),
+    so this is the way to release it in a long-lived process; it is also needed after
+    rewriting files in place with preserved mtimes and sizes.
+    """
+    _HEADER_CACHE.clear()
+
+def _header_bytes(p: Path, st: os.stat_result) -> bytes:
+    """
+    Return the file's first 4 bytes, cached by (path, st_mtime_ns, st_size).
+
+    A header cannot change without the file's mtime/size changing, so repeat
+    validations of an unchanged cache file skip the open + read.
+    """
+    key = (str(p), st.st_mtime_ns, st.st_size)
+    head4 = _HEADER_CACHE.get(key)
+    if head4 is None:
+        # Raw fd + pread: no buffered-IO wrapper (and its 8 KiB buffer) for a 4-byte read
+        fd = os.open(p, os.O_RDONLY)
+        try:
+            head4 = os.pread(fd, 4, 0)
+        finally:
+            os.close(fd)
+        _HEADER_CACHE[key] = head4
+    return head4
+
 def validate_netcdf_file(path: str | Path, min_bytes: int = DEFAULT_MIN_BYTES) -> tuple[bool, str]:
     """
     Validate that a local file looks like a real NetCDF file.
@@ -30,37 +122,167 @@ def validate_netcdf_file(path: str | Path, min_bytes: int = DEFAULT_MIN_BYTES) -
     3) header signature indicates NetCDF classic (b"CDF") or NetCDF4/HDF5 (b"\\x89HDF")
     """
     p = Path(path)
-    if not p.exists():
+    try:
+        st = p.stat()
+    except FileNotFoundError:
         return False, f"path={p} missing"
+    return _validate_stat(p, st, min_bytes)
 
-    size = p.stat().st_size
+
+def _validate_stat(p: Path, st: os.stat_result, min_bytes: int) -> tuple[bool, str]:
+    """validate_netcdf_file for a file the caller already stat()ed (e.g. via os.scandir)."""
+    size = st.st_size
     if size < min_bytes:
         return False, f"path={p} too_small size={size}B min_bytes={min_bytes}"
 
-    with p.open("rb") as f:
-        head4 = f.read(4)
+    head4 = _header_bytes(p, st)
 
-    if head4.startswith(b"CDF"):
-        return True, f"path={p} netcdf_classic size={size}B"
+    fmt = _netcdf_format(head4)
+    if fmt is not None:
+        return True, f"path={p} {fmt} size={size}B"
 
+    return False, f"path={p} bad_header head4={head4!r} size={size}B"
+
+def _netcdf_format(head4: bytes) -> str | None:
+    """NetCDF flavour named by the 4 header bytes, or None when they are not NetCDF."""
+    if head4.startswith(b"CDF"):
+        return "netcdf_classic"
     if head4 == b"\x89HDF":
-        return True, f"path={p} netcdf4_hdf5 size={size}B"
+        return "netcdf4_hdf5"
+    return None
 
-    return False, f"path={p} bad_header head4={head4!r} size={size}B"
 
+def netcdf_engine(path: str | Path) -> str | None:
+    """
+    Pick an xarray backend from the file header.
+
+    - NetCDF4/HDF5 (b"\\x89HDF") -> "h5netcdf" (faster chunked reads than netCDF4-python)
+    - NetCDF classic (b"CDF", ERDDAP's usual .nc output) -> None (xarray default;
+      h5netcdf cannot read classic files)
+    """
+    p = Path(path)
+    return "h5netcdf" if _header_bytes(p, p.stat()) == b"\x89HDF" else None
+
+class DownloadError(RuntimeError):
+    """
+    A failed NetCDF download.
+
+    status: HTTP status when the server answered (None for network errors).
+    retry_after: seconds from the server's Retry-After header, if any.
+    """
+
+    def __init__(self, msg: str, *, status: int | None = None, retry_after: float | None = None) -> None:
+        super().__init__(msg)
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        # 4xx means the request itself is wrong (bad constraint, unknown dataset); only 429 may clear
+        return self.status is None or self.status == 429 or not 400 <= self.status < 500
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After in seconds (delta-seconds form only; HTTP-date values are ignored)."""
+    try:
+        return min(float(value), MAX_RETRY_AFTER_SECONDS) if value else None
+    except ValueError:
+        return None
+
+def _backoff_seconds(attempt: int, err: Exception) -> float:
+    """Server-requested Retry-After if given, else exponential backoff with jitter."""
+    retry_after = getattr(err, "retry_after", None)
+    if retry_after is not None:
+        return retry_after
+    return BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)) + random.uniform(0, 1)
+
+def _copy_stream(src, dst, bufsize: int = DOWNLOAD_BUFFER_BYTES) -> None:
+    """
+    Copy a readable stream into a file through one preallocated buffer.
+
+    readinto() fills the same bytearray every iteration (no per-read allocation);
+    the memoryview slice writes only the bytes actually received.
+    """
+    buf = bytearray(bufsize)
+    view = memoryview(buf)
+    while True:
+        n = src.readinto(buf)
+        if not n:
+            break
+        dst.write(view[:n])
+
+def _open_preallocated(path: Path, content_length: str | None) -> BinaryIO:
+    """
+    Open `path` for writing, reserving `content_length` bytes up front when known.
 
-def _download_with_urlopen(url: str, tmp_path: Path, timeout: int = 180) -> None:
-    req = urllib.request.Request(url, headers={"User-Agent": "ocean-drivers-anomaly-detection/1.0"})
+    posix_fallocate gives the filesystem one contiguous allocation (and one metadata
+    update) instead of growing the file write by write. Skipped where unsupported.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as r:
-            if getattr(r, "status", 200) != 200:
-                raise RuntimeError(f"HTTP status={getattr(r, 'status', None)} for url={url}")
-            with tmp_path.open("wb") as f:
-                shutil.copyfileobj(r, f)
-    except HTTPError as e:
-        raise RuntimeError(f"HTTPError status={e.code} reason={e.reason} url={url}") from e
-    except URLError as e:
-        raise RuntimeError(f"URLError reason={e.reason} url={url}") from e
+        size = int(content_length or 0)
+    except ValueError:
+        size = 0
+    if size > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass  # e.g. filesystems without fallocate support; plain writes still work
+    return os.fdopen(fd, "wb", buffering=DOWNLOAD_BUFFER_BYTES)
+
+
+def _http_pool() -> urllib3.PoolManager:
+    """
+    Process-wide pooled HTTP client (keep-alive), created on first use.
+
+    Repeat ERDDAP downloads (retries, regions x months backfills) reuse the open
+    TCP+TLS connection instead of paying a handshake per file. Sockets get a
+    SOCKET_RCVBUF_BYTES receive buffer for bulk NetCDF bodies. urllib3 retries are
+    off: ensure_local_netcdf owns the retry/backoff policy.
+    """
+    global _HTTP_POOL
+    if _HTTP_POOL is None:
+        _HTTP_POOL = urllib3.PoolManager(
+            maxsize=HTTP_POOL_MAXSIZE,
+            retries=False,
+            headers=_HTTP_HEADERS,
+            socket_options=HTTPConnection.default_socket_options
+            + [(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF_BYTES)],
+        )
+    return _HTTP_POOL
+
+
+def _download_url(url: str, tmp_path: Path, timeout: int = 180) -> None:
+    # file:// mirrors/caches: shutil.copyfile uses os.sendfile on Linux (no user-space copy)
+    parts = urlsplit(url)
+    if parts.scheme == "file":
+        try:
+            shutil.copyfile(url2pathname(parts.path), tmp_path)
+        except OSError as e:
+            raise RuntimeError(f"file copy failed err={e} url={url}") from e
+        return
+
+    try:
+        r = _http_pool().request("GET", url, preload_content=False, timeout=timeout)
+    except urllib3.exceptions.HTTPError as e:
+        raise DownloadError(f"URLError reason={e} url={url}") from e
+
+    try:
+        if r.status != 200:
+            raise DownloadError(
+                f"HTTPError status={r.status} reason={r.reason} url={url}",
+                status=r.status,
+                retry_after=_parse_retry_after(r.headers.get("Retry-After")),
+            )
+        with _open_preallocated(tmp_path, r.headers.get("Content-Length")) as f:
+            _copy_stream(r, f)
+            # Drop any preallocated tail (short body, or Content-Length of an encoded body)
+            f.truncate()
+    except urllib3.exceptions.HTTPError as e:
+        raise DownloadError(f"URLError reason={e} url={url}") from e
+    finally:
+        # Return the (drained) connection to the pool for the next download
+        r.drain_conn()
+        r.release_conn()
 
 
 def ensure_local_netcdf(
@@ -77,7 +299,8 @@ def ensure_local_netcdf(
     Behavior:
     1) If a cached file exists, passes validation, and force_download=False, reuse it.
     2) Otherwise download to a temporary ".part" file, validate it, then atomically rename into place.
-    3) Retry downloads on transient failures.
+    3) Retry downloads on transient failures: exponential backoff with jitter (or the
+       server's Retry-After); 4xx other than 429 fail immediately.
     """
     local_nc.parent.mkdir(parents=True, exist_ok=True)
 
@@ -99,30 +322,132 @@ def ensure_local_netcdf(
             if tmp_path.exists():
                 tmp_path.unlink()
 
-            _download_with_urlopen(safe_url, tmp_path, timeout=180)
+            _download_url(safe_url, tmp_path, timeout=180)
 
             ok_tmp, info_tmp = validate_netcdf_file(tmp_path, min_bytes=min_bytes)
             if not ok_tmp:
                 raise RuntimeError(f"Downloaded temp file failed validation: {info_tmp}")
 
+            # Validated before the rename; the rename itself doesn't change the bytes
             tmp_path.replace(local_nc)
             last_err = None
             break
 
         except Exception as e:
             last_err = e
-            is_last = attempt == MAX_DOWNLOAD_ATTEMPTS
+            is_last = attempt == MAX_DOWNLOAD_ATTEMPTS or (isinstance(e, DownloadError) and not e.retryable)
             level: LogLevel = "ERROR" if is_last else "INFO"
             log(f"download_attempt_failed attempt={attempt}/{MAX_DOWNLOAD_ATTEMPTS} err={e}", level=level)
 
-            if not is_last:
-                time.sleep(BACKOFF_BASE_SECONDS * attempt)
+            if is_last:
+                break
+            time.sleep(_backoff_seconds(attempt, e))
 
     if last_err is not None:
         raise RuntimeError(f"Failed to download after retries: {last_err}")
 
-    ok2, info2 = validate_netcdf_file(local_nc, min_bytes=min_bytes)
-    if not ok2:
-        raise RuntimeError(f"Downloaded file failed validation: {info2}")
+    # The .part path named in info_tmp is gone after the rename: report the final file
+    # (its header read also primes _HEADER_CACHE for the callers' next validate/open)
+    st = local_nc.stat()
+    log(
+        f"download_complete=true dest={local_nc} size={st.st_size}B "
+        f"format={_netcdf_format(_header_bytes(local_nc, st))}",
+        level="INFO",
+    )
+
+
+def _sidecar_path(local_nc: Path) -> Path:
+    return local_nc.with_suffix(local_nc.suffix + ".json")
+
+
+def find_covering_netcdf(
+    out_dir: Path,
+    request: SubsetRequest,
+    *,
+    min_bytes: int = DEFAULT_MIN_BYTES,
+) -> tuple[Path, SubsetRequest] | None:
+    """
+    Find a valid cached NetCDF in out_dir whose recorded subset covers `request`.
+
+    Each content-addressed download has a JSON sidecar holding its SubsetRequest;
+    the request bounds are recorded because grid-cell coordinates alone cannot tell
+    whether a file was cut from a wider query window.
+
+    Prefers the exact cache key, then the smallest covering bbox.
+    """
+    exact = out_dir / f"{request.dataset_id}_{request.cache_key()}.nc"
+    candidates: list[tuple[float, Path, SubsetRequest]] = []
+
+    # One directory scan; each DirEntry caches its stat, so validating a candidate
+    # costs no extra exists()/stat() calls.
+    prefix = f"{request.dataset_id}_"
+    try:
+        with os.scandir(out_dir) as it:
+            entries = {e.name: e for e in it if e.name.startswith(prefix)}
+    except FileNotFoundError:
+        return None
+
+    for name, sidecar in entries.items():
+        if not name.endswith(".nc.json"):
+            continue
+        nc_entry = entries.get(name[: -len(".json")])
+        if nc_entry is None:
+            continue
+        try:
+            with open(sidecar.path, encoding="utf-8") as f:
+                cached = SubsetRequest(**json.load(f))
+        except (OSError, TypeError, ValueError):
+            continue
+        if not cached.covers(request):
+            continue
+
+        local_nc = Path(nc_entry.path)
+        ok, _info = _validate_stat(local_nc, nc_entry.stat(), min_bytes)
+        if not ok:
+            continue
+
+        if local_nc == exact:
+            return local_nc, cached
+        area = (cached.lat_max - cached.lat_min) * (cached.lon_max - cached.lon_min)
+        candidates.append((area, local_nc, cached))
+
+    if not candidates:
+        return None
+    _area, local_nc, cached = min(candidates, key=lambda c: c[0])
+    return local_nc, cached
+
+
+def ensure_cached_netcdf(
+    url: str,
+    out_dir: Path,
+    request: SubsetRequest,
+    *,
+    force_download: bool,
+    log: LogFn,
+    min_bytes: int = DEFAULT_MIN_BYTES,
+) -> tuple[Path, SubsetRequest]:
+    """
+    Content-addressed variant of ensure_local_netcdf, shared across regions/runs.
+
+    Behavior:
+    1) Unless force_download, reuse any cached file (same dataset) whose recorded
+       subset covers `request` — e.g. an overlapping region's larger bbox.
+    2) Otherwise download to out_dir/<dataset_id>_<cache_key>.nc and record the
+       request in a JSON sidecar.
+
+    Returns (path, subset the file holds). When that subset is wider than
+    `request`, callers must cut the data back to their own bbox/time window.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if not force_download:
+        hit = find_covering_netcdf(out_dir, request, min_bytes=min_bytes)
+        if hit is not None:
+            local_nc, cached = hit
+            log(f"using_covering_cache=true path={local_nc} exact={cached == request}", level="DEBUG")
+            return local_nc, cached
 
-    log(f"download_complete=true ({info2})", level="INFO")
+    local_nc = out_dir / f"{request.dataset_id}_{request.cache_key()}.nc"
+    ensure_local_netcdf(url, local_nc, force_download=force_download, log=log, min_bytes=min_bytes)
+    _sidecar_path(local_nc).write_text(json.dumps(asdict(request)), encoding="utf-8")
+    return local_nc, request
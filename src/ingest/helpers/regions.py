@@ -1,31 +1,43 @@
 #!/usr/bin/env python3
 
+import os
 from dataclasses import dataclass
 import yaml
 
-@dataclass(frozen=True)
+try:  # libyaml-backed parser when available (~10x faster than the pure-Python one)
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+@dataclass(frozen=True, slots=True)
 class BoundBox:
     lat_min: float
     lat_max: float
     lon_min: float
     lon_max: float
 
+# (path, st_mtime_ns) -> parsed regions; an edited file gets a new key
+_REGIONS_CACHE: dict[tuple[str, int], dict[str, BoundBox]] = {}
+
 def load_regions(
     path: str
 ) -> dict[str, BoundBox]:
     """
     Load region bounding boxes from YAML and return mapping region_id -> BoundBox.
+
+    Parsed results are cached per (path, mtime), so repeat calls in one process are free.
     """
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    cached = _REGIONS_CACHE.get(key)
+    if cached is not None:
+        return dict(cached)
+
     with open(path, 'r', encoding='utf-8') as f:
-        cfg = yaml.safe_load(f)
-
-    out: dict[str, BoundBox] = {}
-    for region_id, spec in cfg['regions'].items():
-        bb = spec['boundbox']
-        out[region_id] = BoundBox(
-            lat_min=float(bb['lat_min']),
-            lat_max=float(bb['lat_max']),
-            lon_min=float(bb['lon_min']),
-            lon_max=float(bb['lon_max']),
-        )
-    return out
+        cfg = yaml.load(f, Loader=_YamlLoader)
+
+    out = {
+        region_id: BoundBox(**{k: float(v) for k, v in spec['boundbox'].items()})
+        for region_id, spec in cfg['regions'].items()
+    }
+    _REGIONS_CACHE[key] = out
+    return dict(out)
@@ -2,15 +2,72 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from pathlib import Path
-from typing import Iterator, List, Sequence
+from typing import Mapping, TypeVar
 
+import numpy as np
+import pandas as pd
 import xarray as xr
 
-def standardize_lat_lon(da: xr.DataArray) -> xr.DataArray:
+try:  # optional: fused, multi-threaded fill masking for large in-memory arrays
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+XrObj = TypeVar("XrObj", xr.DataArray, xr.Dataset)
+
+# h5py's raw-chunk cache per open file defaults to 1 MiB / 521 slots: too small to hold
+# a time chunk, so every traversal re-inflates the same HDF5 chunks
+HDF5_CHUNK_CACHE_BYTES = 64 * 1024 * 1024
+HDF5_CHUNK_CACHE_SLOTS = 10007  # prime, well above the chunks a cache this size holds
+HDF5_CHUNK_CACHE_PREEMPTION = 0.75
+
+# Below this many cells the numpy path wins (no kernel dispatch / first-call JIT)
+NUMBA_MIN_CELLS = 1 << 20
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _mask_fill_kernel(flat, fill_value, use_fill, fallback_max):
+        # One pass: compare + write per cell. No fastmath: it would assume no NaNs.
+        out = np.empty_like(flat)
+        for i in prange(flat.size):
+            v = flat[i]
+            if (use_fill and v == fill_value) or (not use_fill and v >= fallback_max):
+                out[i] = np.nan
+            else:
+                out[i] = v
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _segment_nanmean_kernel(a, starts):
+        # a: (T, cells) C-contiguous; one output row per [starts[d], starts[d+1]) segment.
+        # prange over segments, inner loop over contiguous cells; no fastmath (NaN checks).
+        n_seg = starts.size
+        n_t, n_cells = a.shape
+        out = np.empty((n_seg, n_cells), dtype=a.dtype)
+        for d in prange(n_seg):
+            t1 = starts[d + 1] if d + 1 < n_seg else n_t
+            acc = np.zeros(n_cells, dtype=np.float64)
+            cnt = np.zeros(n_cells, dtype=np.int32)
+            for t in range(starts[d], t1):
+                for c in range(n_cells):
+                    v = a[t, c]
+                    if v == v:
+                        acc[c] += v
+                        cnt[c] += 1
+            for c in range(n_cells):
+                out[d, c] = acc[c] / cnt[c] if cnt[c] > 0 else np.nan
+        return out
+
+else:
+    _mask_fill_kernel = None
+    _segment_nanmean_kernel = None
+
+def standardize_lat_lon(da: XrObj) -> XrObj:
     """
     Rename common coordinate names to standard: latitude->lat, longitude->lon.
+
+    Works on a DataArray or a whole Dataset.
     """
     rename_map: dict[str, str] = {}
     if "latitude" in da.coords:
@@ -21,13 +78,37 @@ def standardize_lat_lon(da: xr.DataArray) -> xr.DataArray:
         da = da.rename(rename_map)
     return da
 
-def drop_singleton_dim(da: xr.DataArray, dim: str, value: float) -> xr.DataArray:
+def select_bbox(
+    da: xr.DataArray,
+    *,
+    lat_min: float,
+    lat_max: float,
+    lon_min: float,
+    lon_max: float,
+) -> xr.DataArray:
     """
-    Drop a singleton dimension (like depth/altitude) if present.
+    Keep only grid cells with lat/lon inside the inclusive bbox (any coordinate order).
+
+    Used when a cached file was downloaded for a wider bbox than the current request.
     """
-    if dim in da.dims:
-        return da.sel({dim: value}, drop=True)
-    return da
+    la = da["lat"].values
+    lo = da["lon"].values
+    return da.isel(
+        lat=np.flatnonzero((la >= lat_min) & (la <= lat_max)),
+        lon=np.flatnonzero((lo >= lon_min) & (lo <= lon_max)),
+    )
+
+def fill_value_of(da: xr.DataArray) -> float | None:
+    """
+    Return the numeric _FillValue (or missing_value) from attrs, or None if absent/unparseable.
+    """
+    fill_value = da.attrs.get("_FillValue", da.attrs.get("missing_value"))
+    if fill_value is None:
+        return None
+    try:
+        return float(fill_value)
+    except (TypeError, ValueError):
+        return None
 
 def apply_fill_to_nan(da: xr.DataArray, fallback_max: float = 9e35) -> xr.DataArray:
     """
@@ -35,35 +116,190 @@ def apply_fill_to_nan(da: xr.DataArray, fallback_max: float = 9e35) -> xr.DataAr
 
     - Uses _FillValue or missing_value if present.
     - Falls back to filtering huge ERDDAP sentinel fills (>= fallback_max).
+
+    In-memory (numpy-backed) arrays are masked with one vectorized compare + assign
+    on a float copy of the values; dask-backed arrays keep the lazy da.where path.
+    With numba installed, large float arrays use a fused parallel kernel instead
+    (one read + one write per cell, across cores).
     """
-    fill_value = da.attrs.get("_FillValue", da.attrs.get("missing_value"))
+    fv = fill_value_of(da)
+
+    if not isinstance(da.data, np.ndarray):
+        return da.where(da != fv) if fv is not None else da.where(da < fallback_max)
+
+    vals = da.values
+    if _mask_fill_kernel is not None and vals.size >= NUMBA_MIN_CELLS and np.issubdtype(vals.dtype, np.floating):
+        flat = np.ascontiguousarray(vals).reshape(-1)
+        out = _mask_fill_kernel(flat, 0.0 if fv is None else fv, fv is not None, fallback_max)
+        return da.copy(data=out.reshape(vals.shape))
+
+    vals = vals.astype(vals.dtype if np.issubdtype(vals.dtype, np.floating) else np.float64, copy=True)
+    if fv is not None:
+        vals[vals == fv] = np.nan
+    else:
+        vals[vals >= fallback_max] = np.nan
+    return da.copy(data=vals)
+
+def valid_mask(vals: np.ndarray, fill_value: float | None, fallback_max: float = 9e35) -> np.ndarray:
+    """
+    Boolean mask of usable cells in a raw value array, built in one fused pass.
+
+    A cell is usable when it is finite and not the fill value (or below fallback_max
+    when there is no fill attr). The comparison writes into a single reused scratch
+    buffer and is ANDed in place, instead of allocating one temporary per condition.
+    """
+    keep = np.isfinite(vals)
+    scratch = np.empty_like(keep)
     if fill_value is not None:
-        try:
-            fv = float(fill_value)
-            da = da.where(da != fv)
-        except (TypeError, ValueError):
-            da = da.where(da < fallback_max)
+        np.not_equal(vals, fill_value, out=scratch)
     else:
-        da = da.where(da < fallback_max)
-    return da
+        np.less(vals, fallback_max, out=scratch)
+    keep &= scratch
+    return keep
 
-@contextmanager
-def open_xr_datasets(paths: Sequence[Path]) -> Iterator[List[xr.Dataset]]:
+def mask_out_of_range(vals: np.ndarray, vmin: float, vmax: float) -> np.ndarray:
     """
-    Context manager to open multiple datasets and ensure they are closed.
+    Set cells of a float array outside [vmin, vmax] to NaN, in place; returns `vals`.
 
-    Supports "avoid .load()" pipelines:
-    - Keep datasets open while xarray lazily reads during to_dataframe()
-    - Close files once conversion is done
+    Both compares write into one reused bool buffer and np.putmask applies each, so
+    there is no (vals < vmin) | (vals > vmax) temporary pair and no fancy-index
+    scatter. NaN cells compare False and stay NaN.
     """
-    dsets: List[xr.Dataset] = []
-    try:
-        for p in paths:
-            dsets.append(xr.open_dataset(p))
-        yield dsets
-    finally:
-        for ds in dsets:
-            try:
-                ds.close()
-            except Exception:
-                pass
+    mask = np.empty(vals.shape, dtype=bool)
+    np.less(vals, vmin, out=mask)
+    np.putmask(vals, mask, np.nan)
+    np.greater(vals, vmax, out=mask)
+    np.putmask(vals, mask, np.nan)
+    return vals
+
+def daily_nanmean(a: np.ndarray, times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    NaN-skipping mean of `a` over axis 0 per UTC day of `times` (sorted, one per step).
+
+    Returns (days as datetime64[D], means shaped (n_days, *a.shape[1:])); a cell
+    with no valid step in a day is NaN. Days may hold any number of steps, so a
+    partial first/last day needs no special casing.
+
+    Uses a parallel numba kernel (sum + count per segment in one pass) when numba is
+    installed and the array is large; otherwise np.add.reduceat over the NaN-zeroed
+    values and the valid-count mask.
+    """
+    day_of_step = times.astype("datetime64[D]")
+    starts = np.flatnonzero(np.r_[True, day_of_step[1:] != day_of_step[:-1]])
+    days = day_of_step[starts]
+    flat = np.ascontiguousarray(a).reshape(a.shape[0], -1)
+
+    if _segment_nanmean_kernel is not None and flat.size >= NUMBA_MIN_CELLS and np.issubdtype(flat.dtype, np.floating):
+        out = _segment_nanmean_kernel(flat, starts)
+    else:
+        valid = ~np.isnan(flat)
+        sums = np.add.reduceat(np.where(valid, flat, 0), starts, axis=0, dtype=np.float64)
+        counts = np.add.reduceat(valid, starts, axis=0, dtype=np.int32)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = (sums / counts).astype(flat.dtype, copy=False)
+
+    return days, out.reshape((days.size, *a.shape[1:]))
+
+def to_long_columns(
+    da: xr.DataArray,
+    *,
+    value_col: str,
+    time_cols: Mapping[str, np.ndarray] | None = None,
+    drop_missing: bool = False,
+    fallback_max: float = 9e35,
+) -> dict[str, np.ndarray]:
+    """
+    Flatten a (time, lat, lon) DataArray into long 1-D column arrays in one pass.
+
+    Avoids da.to_dataframe().reset_index(), which builds a full MultiIndex first:
+    - values are raveled in C order (time-major, then lat, then lon)
+    - coordinate columns are expanded with np.repeat / np.tile to match
+
+    time_cols:
+    - optional arrays aligned with the time axis (one value per time step), each
+      repeated per cell in place of the raw `time` column. Lets callers derive
+      per-time fields (e.g. window start/end) on the small axis only.
+
+    drop_missing:
+    - if True, cells that are NaN/inf or equal to the _FillValue (or >= fallback_max
+      when no fill attr exists, as in apply_fill_to_nan) are skipped at the ndarray
+      level, so no rows are ever built for land/cloud-masked cells. Raw, unmasked
+      values (open_dataset(..., mask_and_scale=False)) need no apply_fill_to_nan pass.
+
+    Returns columns: time (or time_cols), lat, lon, <value_col> -- plain ndarrays, so
+    callers can build a DataFrame (to_long_dataframe) or an Arrow table.
+    """
+    da = da.transpose("time", "lat", "lon")
+
+    t = da["time"].values
+    la = da["lat"].values
+    lo = da["lon"].values
+    vals = np.ascontiguousarray(da.values).reshape(-1)
+
+    if time_cols is None:
+        time_cols = {"time": t}
+
+    cells_per_step = la.size * lo.size
+    cols: dict[str, np.ndarray] = {}
+
+    if drop_missing:
+        keep = valid_mask(vals, fill_value_of(da), fallback_max)
+
+        # Recover (time, lat, lon) positions from the kept flat indices.
+        flat_idx = np.flatnonzero(keep)
+        t_idx, cell_idx = np.divmod(flat_idx, cells_per_step)
+        lat_idx, lon_idx = np.divmod(cell_idx, lo.size)
+
+        for name, arr in time_cols.items():
+            cols[name] = np.asarray(arr)[t_idx]
+        cols["lat"] = la[lat_idx]
+        cols["lon"] = lo[lon_idx]
+        cols[value_col] = vals[flat_idx]
+    else:
+        for name, arr in time_cols.items():
+            cols[name] = np.repeat(arr, cells_per_step)
+        cols["lat"] = np.tile(np.repeat(la, lo.size), t.size)
+        cols["lon"] = np.tile(lo, t.size * la.size)
+        cols[value_col] = vals
+
+    return cols
+
+def to_long_dataframe(
+    da: xr.DataArray,
+    *,
+    value_col: str,
+    time_cols: Mapping[str, np.ndarray] | None = None,
+    drop_missing: bool = False,
+    fallback_max: float = 9e35,
+) -> pd.DataFrame:
+    """
+    Flatten a (time, lat, lon) DataArray into a long DataFrame; see to_long_columns.
+
+    Avoids da.to_dataframe().reset_index(), which builds a full MultiIndex first.
+    """
+    cols = to_long_columns(
+        da,
+        value_col=value_col,
+        time_cols=time_cols,
+        drop_missing=drop_missing,
+        fallback_max=fallback_max,
+    )
+    return pd.DataFrame(cols, copy=False)
+
+def chunk_cache_kwargs(engine: str | None) -> dict:
+    """
+    Extra xr.open_dataset kwargs sizing the HDF5 chunk cache for `engine`.
+
+    - "h5netcdf": h5py rdcc_* settings via driver_kwds (HDF5_CHUNK_CACHE_*)
+    - anything else: {} (netCDF4-python already defaults to a 64 MiB cache;
+      classic NetCDF files have no chunks)
+    """
+    if engine != "h5netcdf":
+        return {}
+    return {
+        "driver_kwds": {
+            "rdcc_nbytes": HDF5_CHUNK_CACHE_BYTES,
+            "rdcc_nslots": HDF5_CHUNK_CACHE_SLOTS,
+            "rdcc_w0": HDF5_CHUNK_CACHE_PREEMPTION,
+        }
+    }
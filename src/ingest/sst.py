@@ -10,24 +10,28 @@ import argparse
 import datetime as dt
 import os
 from pathlib import Path
+from typing import Iterable, Iterator
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import xarray as xr
 
 from src.ingest.helpers.pipeline import run_tracked
-from src.ingest.helpers.bq_casting import coerce_df_to_schema
 from src.ingest.helpers.cli_defaults import env_default, env_required
-from src.ingest.helpers.bigquery import delete_existing_sst_rows, load_to_bigquery
+from src.ingest.helpers.bigquery import columns_to_arrow, delete_existing_sst_rows, get_client, load_to_bigquery
 from src.ingest.helpers.dates import month_range
-from src.ingest.helpers.df_validate import require_columns, require_non_nulls
+from src.ingest.helpers.df_validate import require_table_non_nulls
 from src.ingest.helpers.erddap import build_griddap_dims, build_griddap_nc_url_one, lon_to_360, utc_day_bounds
 from src.ingest.helpers.netcdf import ensure_local_netcdf
 from src.ingest.helpers.regions import BoundBox
 from src.ingest.helpers.syslogging import LogFn, make_logger
-from src.ingest.helpers.xr_utils import apply_fill_to_nan, standardize_lat_lon
+from src.ingest.helpers.xr_utils import apply_fill_to_nan, standardize_lat_lon, to_long_columns
 from src.ingest.helpers.region_validate import require_region
 
 DEFAULT_MIN_BYTES = 1024
+DEFAULT_CHUNK_TIME = 1  # days flattened per chunk
 
 ERDDAP_BASE = "https://coastwatch.pfeg.noaa.gov/erddap/griddap"
 DATASET_ID = "ncdcOisst21Agg"
@@ -48,9 +52,7 @@ BQ_SCHEMA = [
 ]
 
 STANDARD_COLS = [name for name, _, _ in BQ_SCHEMA]
-STANDARD_COLS_SET = set(STANDARD_COLS)
 REQUIRED_COLS = [name for name, _, mode in BQ_SCHEMA if mode == "REQUIRED"]
-RAW_REQUIRED_COLS = {"time", "lat", "lon", OUT_VAR}
 
 
 def parse_args() -> argparse.Namespace:
@@ -71,17 +73,14 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--force_download", action="store_true", help="Re-download the NetCDF even if cached exists.")
     p.add_argument("--min_bytes", type=int, default=DEFAULT_MIN_BYTES, help="Minimum bytes for cached NetCDF validity.")
     p.add_argument("--log_row_stats", action="store_true")
+    p.add_argument("--chunk_time", type=int, default=DEFAULT_CHUNK_TIME, help="Days flattened per chunk.")
     p.add_argument("--log_level", default="INFO", choices=["ERROR", "INFO", "DEBUG"], help="Logging verbosity")
     return p.parse_args()
 
 
-def validate_raw_dataframe(df: pd.DataFrame) -> None:
-    require_columns(df, RAW_REQUIRED_COLS, label="sst raw_df")
-
-
-def validate_standardized_dataframe(df: pd.DataFrame) -> None:
-    require_columns(df, STANDARD_COLS_SET, label="sst standardized_df")
-    require_non_nulls(df, REQUIRED_COLS, label="sst standardized_df")
+def validate_standardized_table(table: pa.Table) -> None:
+    # Columns/types are fixed by columns_to_arrow(BQ_SCHEMA); only nulls need checking
+    require_table_non_nulls(table, REQUIRED_COLS, label="sst standardized_table")
 
 
 def build_sst_erddap_url(d0: dt.date, d1: dt.date, *, bb: BoundBox) -> str:
@@ -115,44 +114,85 @@ def build_sst_erddap_url(d0: dt.date, d1: dt.date, *, bb: BoundBox) -> str:
     return build_griddap_nc_url_one(base=ERDDAP_BASE, dataset_id=DATASET_ID, variable=SRC_VAR, dims=dims)
 
 
-def subset_to_long(ds: xr.Dataset, *, region_id: str, log: LogFn) -> pd.DataFrame:
+def iter_chunks(
+    ds: xr.Dataset,
+    *,
+    region_id: str,
+    chunk_time: int = DEFAULT_CHUNK_TIME,
+    ingested_at: pd.Timestamp | None = None,
+    log: LogFn,
+) -> Iterator[pa.Table]:
+    """
+    Yield standardized long rows chunk_time days at a time, as BQ_SCHEMA-typed Arrow tables.
+
+    Only one time slice is flattened at once, so peak memory is bounded by a chunk
+    rather than the full (time x lat x lon) cube. Columns go from NumPy straight to
+    Arrow (what the Parquet load path serializes), skipping pandas entirely.
+
+    ingested_at: the run's ingest timestamp (main passes its start time); defaults to now.
+    """
     da = standardize_lat_lon(ds[SRC_VAR])
 
     if "zlev" in da.dims:
         da = da.sel(zlev=0.0, drop=True)
 
-    da = apply_fill_to_nan(da)
-
-    raw_df = da.to_dataframe(name=OUT_VAR).reset_index()
-    validate_raw_dataframe(raw_df)
+    # UTC day per time step, computed once on the time axis then repeated per cell
+    dates = da["time"].values.astype("datetime64[D]")
+    if ingested_at is None:
+        ingested_at = pd.Timestamp.now(tz="UTC")
 
-    raw_df["date"] = pd.to_datetime(raw_df["time"], utc=True).dt.date
-    raw_df.drop(columns=["time"], inplace=True)
+    for start in range(0, dates.size, chunk_time):
+        # OISST is int16-scaled / float32 at source: float32 loses nothing
+        da_chunk = apply_fill_to_nan(da.isel(time=slice(start, start + chunk_time))).astype(np.float32, copy=False)
 
-    raw_df["region_id"] = region_id
-    raw_df["source"] = SOURCE_NAME
-    raw_df["ingested_at"] = pd.Timestamp.now(tz="UTC")
+        cols = to_long_columns(
+            da_chunk,
+            value_col=OUT_VAR,
+            time_cols={"date": dates[start : start + chunk_time]},
+        )
 
-    raw_df[OUT_VAR] = pd.to_numeric(raw_df[OUT_VAR], errors="coerce")
+        table = columns_to_arrow(
+            {**cols, "region_id": region_id, "source": SOURCE_NAME, "ingested_at": ingested_at},
+            BQ_SCHEMA,
+        )
+        validate_standardized_table(table)
 
-    df = raw_df.loc[:, STANDARD_COLS].copy()
-    validate_standardized_dataframe(df)
+        log(f"chunk_ready date={dates[start]} rows={table.num_rows:,}", level="DEBUG")
+        yield table
 
-    log(f"rows_ready={len(df):,}", level="INFO")
-    return df
 
+def with_row_stats(chunks: Iterable[pa.Table], log: LogFn) -> Iterator[pa.Table]:
+    """
+    Pass `chunks` through unchanged, then log one row_stats line for the whole stream.
 
-def log_row_stats(df: pd.DataFrame, log: LogFn) -> None:
-    if len(df) == 0:
+    Counts, min/max dates and the distinct lat/lon values are accumulated per
+    chunk, so the summary covers the month without holding every chunk at once.
+    """
+    rows = 0
+    min_date = max_date = None
+    lats: list[np.ndarray] = []
+    lons: list[np.ndarray] = []
+    for table in chunks:
+        if table.num_rows:
+            rows += table.num_rows
+            dates = pc.min_max(table["date"])
+            lo, hi = dates["min"].as_py(), dates["max"].as_py()
+            min_date = lo if min_date is None else min(min_date, lo)
+            max_date = hi if max_date is None else max(max_date, hi)
+            lats.append(pc.unique(table["lat"]).to_numpy())
+            lons.append(pc.unique(table["lon"]).to_numpy())
+        yield table
+
+    if rows == 0:
         log("row_stats rows=0", level="INFO")
         return
     log(
         "row_stats "
-        f"rows={len(df):,} "
-        f"min_date={df['date'].min()} "
-        f"max_date={df['date'].max()} "
-        f"unique_lat={df['lat'].nunique()} "
-        f"unique_lon={df['lon'].nunique()}",
+        f"rows={rows:,} "
+        f"min_date={min_date} "
+        f"max_date={max_date} "
+        f"unique_lat={np.unique(np.concatenate(lats)).size} "
+        f"unique_lon={np.unique(np.concatenate(lons)).size}",
         level="INFO",
     )
 
@@ -169,6 +209,7 @@ def main() -> None:
     d0, d1 = month_range(args.year, args.month)
 
     def _job() -> tuple[int, str]:
+        ingested_at = pd.Timestamp.now(tz="UTC")
         log(
             f"start region={args.region_id} period={d0}..{d1} "
             f"dry_run={args.dry_run} replace={args.replace} "
@@ -186,20 +227,37 @@ def main() -> None:
         ensure_local_netcdf(url, local_nc, force_download=args.force_download, min_bytes=args.min_bytes, log=log)
 
         with xr.open_dataset(local_nc) as ds:
-            df = subset_to_long(ds, region_id=args.region_id, log=log)
+            chunks = iter_chunks(
+                ds, region_id=args.region_id, chunk_time=args.chunk_time, ingested_at=ingested_at, log=log
+            )
 
-        if args.log_row_stats:
-            log_row_stats(df, log)
+            if args.log_row_stats:
+                chunks = with_row_stats(chunks, log)
+
+            # Days are flattened one at a time, then joined (zero-copy) into the month's
+            # table, so --replace deletes only once every day decoded and the month
+            # lands in one load job
+            parts = list(chunks)
+
+        table = pa.concat_tables(parts) if parts else None
+        rows_ready = table.num_rows if table is not None else 0
+        log(f"rows_ready={rows_ready:,}", level="INFO")
 
         if args.dry_run:
             log("dry_run: skipped BigQuery load.", level="INFO")
             rows_written = 0
         else:
+            client = get_client(args.bq_project)
             if args.replace:
-                delete_existing_sst_rows(args.bq_project, args.bq_dataset, args.bq_table, args.region_id, d0, d1)
-            df = coerce_df_to_schema(df, BQ_SCHEMA)
-            load_to_bigquery(df, args.bq_project, args.bq_dataset, args.bq_table, BQ_SCHEMA)
-            rows_written = len(df)
+                delete_existing_sst_rows(
+                    args.bq_project, args.bq_dataset, args.bq_table, args.region_id, d0, d1, client=client
+                )
+            rows_written = 0
+            if table is not None:
+                # Already BQ_SCHEMA-typed: no coerce_df_to_schema pass
+                load_to_bigquery(table, args.bq_project, args.bq_dataset, args.bq_table, BQ_SCHEMA, client=client)
+                rows_written = rows_ready
+            log(f"load_bq rows={rows_written:,}", level="INFO")
 
         notes = (
             f"region={args.region_id} year={args.year} month={args.month} "
@@ -8,37 +8,54 @@ Dataset:
     - Thgt: significant wave height (meters)  -> swh_m
     - Tper: peak wave period (second)         -> peak_period_s
 - Coords: latitude/longitude; longitude is 0..360 degrees_east.
-- Time resolution is ~hourly; aggregate to daily means per (date, lat, lon).
+- Time resolution is ~hourly; aggregate to daily means per (date, lat, lon) on NumPy arrays.
+- NetCDFs are read with netCDF4 directly (fill/scale applied by hand, no xarray Dataset).
 
 Notes:
 - Handles dateline-crossing regions by splitting lon request into up to 2 intervals in 0..360 space.
+- Splits the month into --chunk_days windows (one ERDDAP request each) to stay under server limits.
 - ERDDAP query uses an end-exclusive UTC window; we filter rows back to the inclusive month window [d0..d1].
 - Supports --no_depth_dim for datasets without depth.
 - Applies fill/missing values to NaN BEFORE daily averaging.
+- Drops (date, lat, lon) rows where every variable is missing (land cells).
 - Applies conservative physical-range filters.
+- Caches the standardized daily rows as Parquet next to the NetCDFs; reruns skip the
+  NetCDF open + reduce (--force_download rebuilds).
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
+import itertools
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Sequence
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
+import netCDF4
+import numpy as np
 import pandas as pd
-import xarray as xr
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
-from src.ingest.helpers.bq_casting import coerce_df_to_schema
 from src.ingest.helpers.cli_defaults import env_default, env_required
-from src.ingest.helpers.bigquery import delete_existing_waves_rows, load_to_bigquery
+from src.ingest.helpers.bigquery import (
+    DEFAULT_LOAD_CHUNK_ROWS,
+    columns_to_arrow,
+    delete_existing_waves_rows,
+    load_to_bigquery,
+)
 from src.ingest.helpers.syslogging import make_logger, LogFn
-from src.ingest.helpers.dates import month_range
+from src.ingest.helpers.dates import day_windows, month_range
 from src.ingest.helpers.regions import BoundBox
 from src.ingest.helpers.netcdf import ensure_local_netcdf
 from src.ingest.helpers.pipeline import run_tracked
-from src.ingest.helpers.df_validate import require_columns, require_non_nulls
+from src.ingest.helpers.df_validate import require_table_non_nulls
 from src.ingest.helpers.region_validate import require_region
 from src.ingest.helpers.erddap import (
     lon_intervals_360,
@@ -46,15 +63,15 @@ from src.ingest.helpers.erddap import (
     build_griddap_dims,
     build_griddap_nc_url,
 )
-from src.ingest.helpers.xr_utils import (
-    standardize_lat_lon,
-    drop_singleton_dim,
-    apply_fill_to_nan,
-    open_xr_datasets,
-)
+from src.ingest.helpers.xr_utils import daily_nanmean, mask_out_of_range, valid_mask
 
 
 DEFAULT_MIN_BYTES = 1024
+DEFAULT_CHUNK_DAYS = 7  # days per ERDDAP sub-request (stays under the server's prep timeout)
+DOWNLOAD_MAX_WORKERS = 4  # concurrent ERDDAP fetches; kept small to be polite to the server
+REDUCE_MAX_WORKERS = 2  # worker processes for the per-lon-piece reduce (at most two dateline halves)
+DAILY_CACHE_META_KEY = b"waves_daily_subset"  # Parquet schema metadata: subset the cache was built from
+DAILY_CACHE_VERSION = 1  # bump when the NetCDF -> daily reduce changes, so older caches rebuild
 
 ERDDAP_BASE = "https://coastwatch.pfeg.noaa.gov/erddap/griddap"
 DATASET_ID = "NWW3_Global_Best"
@@ -71,6 +88,8 @@ VALUE_RANGES = {
     "peak_period_s": (0.0, 60.0),
 }
 
+# standard.waves_daily: PARTITION BY date (DAY), CLUSTER BY region_id (sql/create_standard_tables.sql),
+# so the --replace DELETE on region_id + date BETWEEN touches only the month's partitions
 BQ_SCHEMA = [
     ("date", "DATE", "REQUIRED"),
     ("region_id", "STRING", "REQUIRED"),
@@ -83,18 +102,19 @@ BQ_SCHEMA = [
 ]
 
 STANDARD_COLS = [name for name, _, _ in BQ_SCHEMA]
-STANDARD_COLS_SET = set(STANDARD_COLS)
 REQUIRED_COLS = [name for name, _, mode in BQ_SCHEMA if mode == "REQUIRED"]
-RAW_REQUIRED_COLS = {"time", "lat", "lon", *set(VAR_MAP.values())}
 
 
 @dataclass(frozen=True)
 class LonIntervalRequest:
     """
-    Represents one ERDDAP request for a specific longitude interval.
+    Represents one ERDDAP request for a specific longitude interval and day window.
+
+    window: inclusive (first_day, last_day) UTC covered by this request.
     """
     url: str
     lon_interval: tuple[float, float]
+    window: tuple[dt.date, dt.date]
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
@@ -113,17 +133,17 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--replace", action="store_true", help="Delete existing rows for region+month before loading.")
     p.add_argument("--force_download", action="store_true", help="Re-download the NetCDF even if cached exists.")
     p.add_argument("--min_bytes", type=int, default=DEFAULT_MIN_BYTES, help="Minimum bytes for cached NetCDF validity.")
+    p.add_argument(
+        "--chunk_rows", type=int, default=DEFAULT_LOAD_CHUNK_ROWS, help="Rows per BigQuery load job."
+    )
+    p.add_argument("--chunk_days", type=int, default=DEFAULT_CHUNK_DAYS, help="Days per ERDDAP sub-request.")
     p.add_argument("--no_depth_dim", action="store_true", help="Do not include a depth dimension slice in ERDDAP query.")
     p.add_argument("--log_row_stats", action="store_true", help="Log min/max dates and counts after transformation")
     p.add_argument("--log_level", default="INFO", choices=["ERROR", "INFO", "DEBUG"], help="Logging verbosity")
     return p.parse_args()
 
-def validate_raw_dataframe(df: pd.DataFrame) -> None:
-    require_columns(df, RAW_REQUIRED_COLS, label="waves raw_df")
-
-def validate_standardized_dataframe(df: pd.DataFrame) -> None:
-    require_columns(df, STANDARD_COLS_SET, label="waves standardized_df")
-    require_non_nulls(df, REQUIRED_COLS, label="waves standardized_df")
+def validate_standardized_table(table: pa.Table) -> None:
+    require_table_non_nulls(table, REQUIRED_COLS, label="waves standardized_table")
 
 def build_lon_interval_requests_0_360(
     *,
@@ -135,20 +155,27 @@ def build_lon_interval_requests_0_360(
     bb: BoundBox,
     include_singleton_dim: bool,
     singleton_value: float = 0.0,
+    chunk_days: int | None = None,
 ) -> list[LonIntervalRequest]:
     """
     Build ERDDAP request specs for 0..360 longitude datasets.
 
     If the region crosses the dateline, this returns multiple requests.
-    Uses an end-exclusive day window: [date_start, date_end + 1 day).
+    chunk_days splits [date_start, date_end] into windows of that many days, one
+    request per (lon interval x window): small subsets finish inside ERDDAP's request
+    timeout/size cap and can be fetched concurrently. None = one window.
+    Each window uses an end-exclusive day bound: [first_day, last_day + 1 day).
+
+    Requests are ordered by lon interval, then by window.
     """
-    t0, t1 = utc_day_bounds(date_start, date_end, end_exclusive=True)
+    windows = day_windows(date_start, date_end, chunk_days) if chunk_days else [(date_start, date_end)]
 
     lat_min, lat_max = sorted([bb.lat_min, bb.lat_max])
 
     requests: list[LonIntervalRequest] = []
 
-    for lo0, lo1 in lon_intervals_360(bb.lon_min, bb.lon_max):
+    for (lo0, lo1), window in itertools.product(lon_intervals_360(bb.lon_min, bb.lon_max), windows):
+        t0, t1 = utc_day_bounds(*window, end_exclusive=True)
         dims = build_griddap_dims(
             t0=t0,
             t1=t1,
@@ -171,6 +198,7 @@ def build_lon_interval_requests_0_360(
             LonIntervalRequest(
                 url=url,
                 lon_interval=(lo0, lo1),
+                window=window,
             )
         )
 
@@ -184,16 +212,20 @@ def _waves_cache_filename(
     idx: int,
     interval: tuple[float, float],
     split: bool,
+    window: tuple[dt.date, dt.date] | None = None,
 ) -> str:
     lo0, lo1 = interval
-    if not split:
-        return f"waves_{region_id}_{year}_{month:02d}.nc"
-    return f"waves_{region_id}_{year}_{month:02d}_part{idx}_lon{lo0:.1f}-{lo1:.1f}.nc"
+    stem = f"waves_{region_id}_{year}_{month:02d}"
+    if split:
+        stem += f"_part{idx}_lon{lo0:.1f}-{lo1:.1f}"
+    if window is not None:
+        stem += f"_d{window[0].day:02d}-{window[1].day:02d}"
+    return f"{stem}.nc"
 
 
 def download_intervals(
     *,
-    interval_requests: list[tuple[LonIntervalRequest],
+    interval_requests: list[LonIntervalRequest],
     out_dir: Path,
     region_id: str,
     year: int,
@@ -201,21 +233,44 @@ def download_intervals(
     force_download: bool,
     min_bytes: int,
     log: LogFn,
-) -> list[Path]:
-    split = len(requests) > 1
-    log(f"dateline_split={split} intervals={len(requests)}", level="INFO")
+) -> list[list[Path]]:
+    """
+    Download every request; returns one time-ordered path list per lon interval.
+
+    Cache names are computed on the calling thread (deterministic order); the fetches
+    run concurrently on a small thread pool.
+    """
+    lon_intervals = list(dict.fromkeys(req.lon_interval for req in interval_requests))
+    split = len(lon_intervals) > 1
+    windowed = len(interval_requests) > len(lon_intervals)
+    log(
+        f"dateline_split={split} intervals={len(lon_intervals)} requests={len(interval_requests)}",
+        level="INFO",
+    )
 
+    pieces: list[list[Path]] = [[] for _ in lon_intervals]
     paths: list[Path] = []
-    for idx, req in enumerate(requests, start=1):
+    for req in interval_requests:
+        idx = lon_intervals.index(req.lon_interval) + 1
         lo0, lo1 = req.lon_interval
-        log(f"lon_interval[{idx}]={lo0:.1f}..{lo1:.1f} (0..360)", level="INFO")
+        w0, w1 = req.window
+        log(f"lon_interval[{idx}]={lo0:.1f}..{lo1:.1f} (0..360) window={w0}..{w1}", level="INFO")
         log(f"fetch_url[{idx}]={req.url}", level="DEBUG")
 
         local_nc = out_dir / _waves_cache_filename(
-            region_id=region_id, year=year, month=month, idx=idx, interval=interval, split=split
+            region_id=region_id,
+            year=year,
+            month=month,
+            idx=idx,
+            interval=req.lon_interval,
+            split=split,
+            window=req.window if windowed else None,
         )
         log(f"download_path[{idx}]={local_nc}", level="DEBUG")
+        pieces[idx - 1].append(local_nc)
+        paths.append(local_nc)
 
+    def _fetch(req: LonIntervalRequest, local_nc: Path) -> None:
         ensure_local_netcdf(
             req.url,
             local_nc,
@@ -223,102 +278,436 @@ def download_intervals(
             min_bytes=min_bytes,
             log=log
         )
-        paths.append(local_nc)
 
-    return paths
+    if len(paths) == 1:
+        _fetch(interval_requests[0], paths[0])
+        return pieces
 
+    # Network-bound: dateline halves and day windows are fetched concurrently (ERDDAP
+    # queue time and transfer overlap); map() re-raises any failure.
+    with ThreadPoolExecutor(max_workers=min(len(paths), DOWNLOAD_MAX_WORKERS)) as pool:
+        list(pool.map(_fetch, interval_requests, paths))
 
-def aggregate_hourly_to_daily_mean(
-    dsets: list[xr.Dataset],
+    return pieces
+
+
+def days_in_window(times: np.ndarray, d0: dt.date, d1: dt.date) -> np.ndarray:
+    """
+    Boolean mask of datetime64 values falling on UTC days [d0, d1].
+
+    One vectorized compare on the int64 datetime64 buffer against np.datetime64 day
+    bounds (no per-element Python date objects).
+    """
+    days = times.astype("datetime64[D]", copy=False)
+    return (days >= np.datetime64(d0, "D")) & (days <= np.datetime64(d1, "D"))
+
+
+def _float32_if_exact(coord: np.ndarray) -> np.ndarray:
+    """Return `coord` as float32 when that represents every value exactly, else unchanged."""
+    as32 = coord.astype(np.float32)
+    return as32 if np.array_equal(as32, coord) else coord
+
+
+@dataclass(frozen=True)
+class HourlyPiece:
+    """One lon piece read straight from NetCDF: hourly times, lat/lon axes, (time, lat, lon) values."""
+
+    times: np.ndarray
+    lats: np.ndarray
+    lons: np.ndarray
+    values: dict[str, np.ndarray]
+
+
+def _nc_coord(nc: netCDF4.Dataset, names: Sequence[str]) -> np.ndarray:
+    for name in names:
+        if name in nc.variables:
+            return np.asarray(nc.variables[name][:])
+    raise ValueError(f"NetCDF has none of the coordinate variables {list(names)}")
+
+
+def read_ww3_raw(
+    path: Path,
     *,
     var_map: dict[str, str],
     singleton_dim: str | None,
     singleton_value: float,
-    value_ranges: dict[str, tuple[float, float]],
-) -> xr.Dataset:
+) -> HourlyPiece:
     """
-    Convert opened datasets into a DAILY-mean dataset.
+    Read one WW3 NetCDF with netCDF4 directly (no xarray Dataset / CF decoding).
 
-    Pipeline:
-    - Standardize lat/lon coords
-    - Optional singleton dim selection (e.g., depth=0)
-    - apply_fill_to_nan() before aggregation
-    - physical range filters
-    - resample(time="1D").mean(skipna=True)
-    - concat lon-split pieces along lon and sort
+    - time -> datetime64[s] via netCDF4.num2date
+    - optional singleton dim selection (e.g., depth=0) by index on read
+    - _FillValue / missing_value (or huge ERDDAP sentinel fills) -> NaN, then
+      scale_factor / add_offset applied, into one float32 (time, lat, lon) array
+      per variable, keyed by the var_map output name
     """
-    pieces: list[xr.Dataset] = []
+    with netCDF4.Dataset(path) as nc:
+        # Packed values are read raw, so the fill compare sees the stored sentinel
+        nc.set_auto_maskandscale(False)
+
+        t = nc.variables["time"]
+        times = np.asarray(
+            netCDF4.num2date(
+                t[:],
+                t.units,
+                getattr(t, "calendar", "standard"),
+                only_use_cftime_datetimes=False,
+                only_use_python_datetimes=True,
+            ),
+            dtype="datetime64[s]",
+        )
+        lats = _nc_coord(nc, ("lat", "latitude"))
+        lons = _nc_coord(nc, ("lon", "longitude"))
+
+        values: dict[str, np.ndarray] = {}
+        for src, out in var_map.items():
+            var = nc.variables[src]
+            index: list[int | slice] = []
+            dims: list[str] = []
+            for dim in var.dimensions:
+                if dim == singleton_dim:
+                    at = np.flatnonzero(np.isclose(np.asarray(nc.variables[dim][:]), singleton_value))
+                    if at.size == 0:
+                        raise ValueError(f"{src}: no {dim}={singleton_value} in {path}")
+                    index.append(int(at[0]))
+                else:
+                    index.append(slice(None))
+                    dims.append(dim)
+            if len(dims) != 3 or dims[0] != "time":
+                raise ValueError(f"{src}: expected (time, lat, lon) dims, got {var.dimensions} in {path}")
+
+            raw = np.asarray(var[tuple(index)])
+            fill = getattr(var, "_FillValue", getattr(var, "missing_value", None))
+            keep = valid_mask(raw, None if fill is None else float(np.asarray(fill).ravel()[0]))
+
+            vals = raw.astype(np.float32)
+            scale = getattr(var, "scale_factor", None)
+            offset = getattr(var, "add_offset", None)
+            if scale is not None:
+                vals *= np.float32(scale)
+            if offset is not None:
+                vals += np.float32(offset)
+            np.putmask(vals, ~keep, np.float32(np.nan))
+            values[out] = vals
+
+    return HourlyPiece(times=times, lats=lats, lons=lons, values=values)
+
+
+def read_hourly_piece(
+    paths: Sequence[Path],
+    *,
+    d0: dt.date,
+    d1: dt.date,
+    var_map: dict[str, str],
+    singleton_dim: str | None,
+    singleton_value: float,
+) -> HourlyPiece:
+    """
+    Read one lon piece's day-window files and join them along time.
 
-    for ds in dsets:
-        data_vars: dict[str, xr.DataArray] = {}
+    Each window is cut to the hourly steps on UTC days [d0, d1] that an earlier
+    window did not already return (the boundary step both neighbours include is
+    kept once), so only in-window steps are concatenated.
+    """
+    raws = [
+        read_ww3_raw(p, var_map=var_map, singleton_dim=singleton_dim, singleton_value=singleton_value)
+        for p in paths
+    ]
+
+    steps: list[slice] = []
+    last = None
+    for raw in raws:
+        wanted = days_in_window(raw.times, d0, d1)
+        if last is not None:
+            wanted &= raw.times > last
+        idx = np.flatnonzero(wanted)  # times ascend, so the wanted steps are contiguous
+        steps.append(slice(idx[0], idx[-1] + 1) if idx.size else slice(0, 0))
+        if idx.size:
+            last = raw.times[idx[-1]]
+
+    if len(raws) == 1:
+        # Basic slices are views: no copy for a single-window piece
+        raw, step = raws[0], steps[0]
+        return HourlyPiece(
+            times=raw.times[step],
+            lats=raw.lats,
+            lons=raw.lons,
+            values={c: v[step] for c, v in raw.values.items()},
+        )
+
+    return HourlyPiece(
+        times=np.concatenate([raw.times[step] for raw, step in zip(raws, steps)]),
+        lats=raws[0].lats,
+        lons=raws[0].lons,
+        values={c: np.concatenate([raw.values[c][step] for raw, step in zip(raws, steps)]) for c in var_map.values()},
+    )
 
-        for src_var, out_var in var_map.items():
-            da = standardize_lat_lon(ds[src_var])
 
-            if singleton_dim is not None:
-                da = drop_singleton_dim(da, singleton_dim, singleton_value)
+def reduce_piece(
+    paths: Sequence[Path],
+    *,
+    d0: dt.date,
+    d1: dt.date,
+    var_map: dict[str, str],
+    singleton_dim: str | None,
+    singleton_value: float,
+    value_ranges: dict[str, tuple[float, float]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+    """
+    Read one lon piece and reduce it to daily means: (days, lats, lons, {column: (day, lat, lon)}).
 
-            da = apply_fill_to_nan(da)
+    Pure function of its arguments (paths in, arrays out), so it can run in a worker
+    process; only the small daily arrays travel back, never the hourly cube.
+    """
+    piece = read_hourly_piece(
+        paths,
+        d0=d0,
+        d1=d1,
+        var_map=var_map,
+        singleton_dim=singleton_dim,
+        singleton_value=singleton_value,
+    )
 
-            vmin, vmax = value_ranges[out_var]
-            da = da.where((da >= vmin) & (da <= vmax))
+    daily: dict[str, np.ndarray] = {}
+    for c in var_map.values():
+        hourly = piece.values[c]
+        # Range filter in place on the float32 buffer read_ww3_raw produced (NaN
+        # is safe in a float array): no temporary or second copy of the hourly cube
+        mask_out_of_range(hourly, *value_ranges[c])
 
-            data_vars[out_var] = da
+        # (time, lat, lon) -> (day, lat, lon) on the raw arrays: one NaN-skipping pass
+        days, daily[c] = daily_nanmean(hourly, piece.times)
 
-        ds_daily = xr.Dataset(data_vars).resample(time="1D").mean(skipna=True)
-        pieces.append(ds_daily)
+    return days, piece.lats, piece.lons, daily
 
-    if len(pieces) == 1:
-        return pieces[0]
 
-    return xr.concat(pieces, dim="lon").sortby("lon")
+def aggregate_hourly_to_daily_mean(
+    pieces_paths: Sequence[Sequence[Path]],
+    *,
+    d0: dt.date,
+    d1: dt.date,
+    var_map: dict[str, str],
+    singleton_dim: str | None,
+    singleton_value: float,
+    value_ranges: dict[str, tuple[float, float]],
+) -> dict[str, np.ndarray]:
+    """
+    Convert each lon piece's hourly NetCDFs into DAILY-mean long rows.
 
+    Pipeline:
+    - reduce_piece() per lon piece: read (fills already NaN), physical range filters
+      in place, daily_nanmean() per variable (UTC day bins, NaN-skipping)
+    - dateline regions (two pieces) reduce in a process pool, one worker per piece;
+      a single piece runs inline (no pool startup)
+    - stitch lon-split pieces west to east with np.concatenate
+    - flatten once, keeping only cells where some variable is non-NaN
+
+    Returns long 1-D column arrays: date (UTC day, datetime64), lat, lon,
+    <var_map values> (float32); rows with every variable missing (e.g. land) are
+    dropped. The reduction runs on NumPy arrays (a parallel numba kernel when
+    installed) rather than a per-bin xarray resample or a pandas groupby; the
+    columns go straight to Arrow in daily_to_table.
+    """
+    out_cols = list(var_map.values())
+    reduce = partial(
+        reduce_piece,
+        d0=d0,
+        d1=d1,
+        var_map=var_map,
+        singleton_dim=singleton_dim,
+        singleton_value=singleton_value,
+        value_ranges=value_ranges,
+    )
 
-def daily_to_dataframe(
-    ds_daily: xr.Dataset,
+    if len(pieces_paths) == 1:
+        reduced = [reduce(pieces_paths[0])]
+    else:
+        # Pieces are independent and CPU-bound: separate processes sidestep the GIL
+        with ProcessPoolExecutor(max_workers=min(len(pieces_paths), REDUCE_MAX_WORKERS)) as pool:
+            reduced = list(pool.map(reduce, pieces_paths))
+
+    days, lats = reduced[0][0], reduced[0][1]
+    pieces: list[tuple[np.ndarray, dict[str, np.ndarray]]] = []
+    for piece_days, piece_lats, piece_lons, daily in reduced:
+        if not (np.array_equal(days, piece_days) and np.array_equal(lats, piece_lats)):
+            raise ValueError("lon pieces cover different days or latitudes; cannot stitch along lon")
+        pieces.append((piece_lons, daily))
+
+    # Lon pieces are disjoint ascending intervals: ordering them by first lon and
+    # concatenating gives the sorted grid (no xr.concat + sortby argsort/gather)
+    pieces.sort(key=lambda piece: piece[0][0])
+    lons = np.concatenate([piece_lons for piece_lons, _ in pieces])
+    values = {c: np.concatenate([daily[c] for _, daily in pieces], axis=2).ravel() for c in out_cols}
+
+    # Cells where every variable is NaN (land, masked fills) never reach a frame:
+    # gather only the kept flat indices instead of materializing the dense grid
+    missing = np.ones(next(iter(values.values())).shape, dtype=bool)
+    for v in values.values():
+        missing &= np.isnan(v)
+    keep = np.flatnonzero(~missing)
+
+    # float32 coords halve the lat/lon Parquet bytes; only when exact (e.g. ERDDAP's
+    # float32 axes), so no grid point moves and joins against other drivers still match
+    lats, lons = _float32_if_exact(lats), _float32_if_exact(lons)
+
+    # Per-cell coordinates are built once on the stitched (lat, lon) grid (lat is
+    # shared by every lon piece), so each row needs one divmod and a gather by cell
+    # rather than a second divmod into separate lat/lon positions
+    d_idx, cell = np.divmod(keep, lats.size * lons.size)
+    cell_lat = np.repeat(lats, lons.size)
+    cell_lon = np.tile(lons, lats.size)
+
+    return {
+        "date": days[d_idx],
+        "lat": cell_lat[cell],
+        "lon": cell_lon[cell],
+        **{c: v[keep].astype(np.float32, copy=False) for c, v in values.items()},
+    }
+
+
+def daily_to_table(
+    daily: dict[str, np.ndarray],
     *,
     region_id: str,
     d0: dt.date,
     d1: dt.date,
+    ingested_at: pd.Timestamp | None = None,
     log: LogFn,
-) -> pd.DataFrame:
-    if "time" not in ds_daily.coords and "time" not in ds_daily.dims:
-        raise ValueError("ds_daily has no 'time' coordinate/dimension; cannot convert to daily dataframe")
+) -> pa.Table:
+    """
+    Standardize the daily columns into a BQ_SCHEMA-typed Arrow table.
+
+    Columns go from NumPy straight to Arrow (what the Parquet load path serializes):
+    no pandas frame, no BlockManager copies, no schema coercion pass.
+
+    ingested_at: the run's ingest timestamp (main passes its start time); defaults to now.
+    """
+    # Filter back to requested inclusive window (query is end-exclusive). When
+    # build_daily_table already trimmed the hourly steps every row is in window:
+    # pass the arrays through instead of copying each column via a mask
+    in_window = days_in_window(daily["date"], d0, d1)
+    if not in_window.all():
+        daily = {c: v[in_window] for c, v in daily.items()}
+
+    table = columns_to_arrow(
+        {
+            **daily,
+            "region_id": region_id,
+            "source": SOURCE_NAME,
+            "ingested_at": ingested_at if ingested_at is not None else pd.Timestamp.now(tz="UTC"),
+        },
+        BQ_SCHEMA,
+    )
+    validate_standardized_table(table)
 
-    raw_df = ds_daily.to_dataframe().reset_index()
-    validate_raw_dataframe(raw_df)
+    log(f"daily_rows={table.num_rows:,}", level="INFO")
+    return table
 
-    raw_df["date"] = pd.to_datetime(raw_df["time"], utc=True).dt.date
-    raw_df.drop(columns=["time"], inplace=True)
 
-    # Filter back to requested inclusive window (query is end-exclusive)
-    raw_df = raw_df[(raw_df["date"] >= d0) & (raw_df["date"] <= d1)].copy()
+def build_daily_table(
+    *,
+    bb: BoundBox,
+    region_id: str,
+    year: int,
+    month: int,
+    out_dir: Path,
+    no_depth_dim: bool,
+    chunk_days: int | None,
+    force_download: bool,
+    min_bytes: int,
+    ingested_at: pd.Timestamp,
+    log: LogFn,
+) -> pa.Table:
+    """Download (or reuse) the month's NetCDFs and reduce them to the standardized daily table."""
+    d0, d1 = month_range(year, month)
+
+    interval_requests = build_lon_interval_requests_0_360(
+        base=ERDDAP_BASE,
+        dataset_id=DATASET_ID,
+        variables=list(VAR_MAP.keys()),
+        date_start=d0,
+        date_end=d1,
+        bb=bb,
+        include_singleton_dim=not no_depth_dim,
+        singleton_value=0.0,
+        chunk_days=chunk_days,
+    )
 
-    raw_df["region_id"] = region_id
-    raw_df["source"] = SOURCE_NAME
-    raw_df["ingested_at"] = pd.Timestamp.now(tz="UTC")
+    pieces = download_intervals(
+        interval_requests=interval_requests,
+        out_dir=out_dir,
+        region_id=region_id,
+        year=year,
+        month=month,
+        force_download=force_download,
+        min_bytes=min_bytes,
+        log=log,
+    )
 
-    for col in VAR_MAP.values():
-        raw_df[col] = pd.to_numeric(raw_df[col], errors="coerce")
+    # Each lon piece is read straight from its NetCDFs, trimmed to [d0, d1] (the
+    # end-exclusive bound's trailing 00:00Z step dropped) and reduced to daily means
+    daily = aggregate_hourly_to_daily_mean(
+        pieces,
+        d0=d0,
+        d1=d1,
+        var_map=VAR_MAP,
+        singleton_dim=None if no_depth_dim else "depth",
+        singleton_value=0.0,
+        value_ranges=VALUE_RANGES,
+    )
+    return daily_to_table(daily, region_id=region_id, d0=d0, d1=d1, ingested_at=ingested_at, log=log)
 
-    df = raw_df.loc[:, STANDARD_COLS].copy()
-    validate_standardized_dataframe(df)
 
-    log(f"daily_rows={len(df):,}", level="INFO")
-    return df
+def read_daily_cache(path: Path, subset: dict, *, ingested_at: pd.Timestamp, log: LogFn) -> pa.Table | None:
+    """
+    Return the standardized daily table cached at `path`, or None on a miss.
 
+    The cache only counts as a hit when the subset it was built from (dataset, bbox,
+    depth handling, var_map, value_ranges, DAILY_CACHE_VERSION; stored in the Parquet
+    schema metadata) matches `subset`, so an edited regions.yaml, different flags or
+    a changed reduce rebuild from the NetCDFs. A hit is restamped with this run's
+    ingested_at.
+    """
+    if not path.exists():
+        log(f"daily_cache=miss path={path}", level="DEBUG")
+        return None
+    meta = pq.read_schema(path).metadata or {}
+    if meta.get(DAILY_CACHE_META_KEY) != json.dumps(subset, sort_keys=True).encode():
+        log(f"daily_cache=stale path={path}", level="INFO")
+        return None
+
+    table = pq.read_table(path)
+    i = table.schema.get_field_index("ingested_at")
+    field = table.schema.field(i)
+    table = table.set_column(i, field, pa.repeat(pa.scalar(ingested_at, type=field.type), table.num_rows))
+    validate_standardized_table(table)
+    log(f"daily_cache=hit path={path} rows={table.num_rows:,}", level="INFO")
+    return table
+
+
+def write_daily_cache(table: pa.Table, path: Path, subset: dict, *, log: LogFn) -> None:
+    """Persist the standardized daily table as zstd Parquet (temp file, then atomic rename)."""
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), DAILY_CACHE_META_KEY: json.dumps(subset, sort_keys=True)}
+    )
+    tmp_path = path.with_suffix(path.suffix + ".part")
+    pq.write_table(table, tmp_path, compression="zstd")
+    tmp_path.replace(path)
+    log(f"daily_cache=written path={path} rows={table.num_rows:,}", level="DEBUG")
 
-def log_row_stats(df: pd.DataFrame, log: LogFn) -> None:
-    if len(df) == 0:
+
+def log_row_stats(table: pa.Table, log: LogFn) -> None:
+    if table.num_rows == 0:
         log("row_stats rows=0", level="INFO")
         return
+    dates = pc.min_max(table["date"])
     log(
         "row_stats "
-        f"rows={len(df):,} "
-        f"min_date={df['date'].min()} "
-        f"max_date={df['date'].max()} "
-        f"unique_lat={df['lat'].nunique()} "
-        f"unique_lon={df['lon'].nunique()}",
+        f"rows={table.num_rows:,} "
+        f"min_date={dates['min']} "
+        f"max_date={dates['max']} "
+        f"unique_lat={pc.count_distinct(table['lat']).as_py()} "
+        f"unique_lon={pc.count_distinct(table['lon']).as_py()}",
         level="INFO",
     )
 
@@ -345,43 +734,41 @@ def main() -> None:
     )
 
     def _job() -> tuple[int, str]:
+        ingested_at = pd.Timestamp.now(tz="UTC")
         out_dir = Path(args.out_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
 
-        interval_requests = build_lon_interval_requests_0_360(
-            base=ERDDAP_BASE,
-            dataset_id=DATASET_ID,
-            variables=list(VAR_MAP.keys()),
-            date_start=d0,
-            date_end=d1,
-            bb=bb,
-            include_singleton_dim=not args.no_depth_dim,
-            singleton_value=0.0,
-        )
-
-        local_paths = download_intervals_requests(
-            requests=interval_requests,
-            out_dir=out_dir,
-            region_id=args.region_id,
-            year=args.year,
-            month=args.month,
-            force_download=args.force_download,
-            min_bytes=args.min_bytes,
-            log=log,
+        cache_path = out_dir / f"waves_{args.region_id}_{args.year}_{args.month:02d}_daily.parquet"
+        subset = {
+            "cache_version": DAILY_CACHE_VERSION,
+            "dataset_id": DATASET_ID,
+            "bbox": asdict(bb),
+            "no_depth_dim": args.no_depth_dim,
+            "var_map": VAR_MAP,
+            "value_ranges": VALUE_RANGES,
+        }
+
+        table = None if args.force_download else read_daily_cache(
+            cache_path, subset, ingested_at=ingested_at, log=log
         )
-
-        with open_xr_datasets(local_paths) as dsets:
-            ds_daily = aggregate_hourly_to_daily_mean(
-                dsets,
-                var_map=VAR_MAP,
-                singleton_dim=None if args.no_depth_dim else "depth",
-                singleton_value=0.0,
-                value_ranges=VALUE_RANGES,
+        if table is None:
+            table = build_daily_table(
+                bb=bb,
+                region_id=args.region_id,
+                year=args.year,
+                month=args.month,
+                out_dir=out_dir,
+                no_depth_dim=args.no_depth_dim,
+                chunk_days=args.chunk_days,
+                force_download=args.force_download,
+                min_bytes=args.min_bytes,
+                ingested_at=ingested_at,
+                log=log,
             )
-            df = daily_to_dataframe(ds_daily, region_id=args.region_id, d0=d0, d1=d1, log=log)
+            write_daily_cache(table, cache_path, subset, log=log)
 
         if args.log_row_stats:
-            log_row_stats(df, log)
+            log_row_stats(table, log)
 
         table_id = f"{args.bq_project}.{args.bq_dataset}.{args.bq_table}"
 
@@ -400,16 +787,18 @@ def main() -> None:
             else:
                 log("replace=false (append only)", level="INFO")
 
-            log(f"load_bq table={table_id} rows={len(df):,}", level="INFO")
-            df = coerce_df_to_schema(df, BQ_SCHEMA)
-            load_to_bigquery(df, args.bq_project, args.bq_dataset, args.bq_table, BQ_SCHEMA)
-            rows_written = len(df)
+            # Already BQ_SCHEMA-typed: no coerce_df_to_schema pass
+            log(f"load_bq table={table_id} rows={table.num_rows:,}", level="INFO")
+            load_to_bigquery(
+                table, args.bq_project, args.bq_dataset, args.bq_table, BQ_SCHEMA, chunk_rows=args.chunk_rows
+            )
+            rows_written = table.num_rows
 
         notes = (
             f"region={args.region_id} year={args.year} month={args.month} "
             f"dry_run={args.dry_run} replace={args.replace} "
             f"table={args.bq_dataset}.{args.bq_table} "
-            f"dataset_id={DATASET_ID} no_depth_dim={args.no_depth_dim}"
+            f"dataset_id={DATASET_ID} no_depth_dim={args.no_depth_dim} chunk_days={args.chunk_days}"
         )
         return rows_written, notes
 